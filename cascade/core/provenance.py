@@ -25,6 +25,7 @@ what happened inside the network.
 
 import hashlib
 import json
+import os
 import time
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any, Tuple
@@ -217,6 +218,21 @@ class ProvenanceChain:
 # HASHING FUNCTIONS
 # =============================================================================
 
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# The default stays SHA-256 so digests remain comparable across
+# installs and with previously recorded tapes/receipts. Setting
+# CASCADE_HASH=blake3 (requires the optional `blake3` package) swaps in
+# BLAKE3's SIMD tree hash for several-fold throughput - only do this
+# for lattices verified with the same setting.
+if os.environ.get("CASCADE_HASH") == "blake3" and _blake3 is not None:
+    _new_hash = _blake3
+else:
+    _new_hash = hashlib.sha256
+
 def hash_tensor(tensor, sample_size: int = 1000) -> str:
     """
     Compute deterministic hash of tensor state.
@@ -240,18 +256,32 @@ def hash_tensor(tensor, sample_size: int = 1000) -> str:
         arr = tensor.numpy()
     else:
         arr = np.array(tensor)
-    
-    # Flatten and sample
-    flat = arr.flatten()
+
+    # Flatten and sample. ravel() returns a view for contiguous input,
+    # and astype(copy=False) is a no-op for float32, so for the common
+    # case (contiguous float32 activations) no bytes are copied.
+    flat = arr.ravel()
     sample = flat[:min(sample_size, len(flat))]
-    
+    sample = np.ascontiguousarray(sample, dtype=np.float32)
+
     # Hash the bytes
-    # Include shape in hash so same values in different shapes hash differently
-    shape_bytes = str(arr.shape).encode('utf-8')
-    tensor_bytes = sample.astype(np.float32).tobytes()
-    
-    combined = shape_bytes + tensor_bytes
-    return hashlib.sha256(combined).hexdigest()[:16]
+    # Include shape in hash so same values in different shapes hash differently.
+    # Feed the hasher incrementally: sample.data is a zero-copy memoryview,
+    # which lets OpenSSL's (hardware-accelerated where available) SHA-256
+    # ingest the buffer directly instead of a concatenated bytes temporary.
+    h = _new_hash()
+    h.update(str(arr.shape).encode('utf-8'))
+    if sample.nbytes > 262144:
+        # Large samples (callers can raise sample_size): feed 64 KiB
+        # slices so the working set stays cache-resident while the
+        # hash core runs, instead of streaming the whole buffer from
+        # DRAM in one update. Identical digest either way.
+        mv = sample.data.cast('B')
+        for i in range(0, len(mv), 65536):
+            h.update(mv[i:i + 65536])
+    else:
+        h.update(sample.data)
+    return h.hexdigest()[:16]
 
 
 def hash_params(module) -> str:
@@ -272,7 +302,7 @@ def hash_params(module) -> str:
         return "no_params"
     
     combined = "|".join(sorted(param_hashes))
-    return hashlib.sha256(combined.encode()).hexdigest()[:16]
+    return _new_hash(combined.encode()).hexdigest()[:16]
 
 
 def hash_model(model) -> str:
@@ -288,7 +318,7 @@ def hash_model(model) -> str:
         all_hashes.append(f"{name}:{h}")
     
     combined = "|".join(all_hashes)
-    return hashlib.sha256(combined.encode()).hexdigest()[:32]
+    return _new_hash(combined.encode()).hexdigest()[:32]
 
 
 def hash_input(data: Any) -> str:
@@ -296,42 +326,113 @@ def hash_input(data: Any) -> str:
     Hash input data (text, tokens, images, etc).
     """
     if isinstance(data, str):
-        return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+        return _new_hash(data.encode('utf-8')).hexdigest()[:16]
     elif hasattr(data, 'detach'):
         return hash_tensor(data)
     elif isinstance(data, dict):
         # Tokenizer output
         combined = json.dumps({k: str(v) for k, v in sorted(data.items())})
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        return _new_hash(combined.encode()).hexdigest()[:16]
     else:
-        return hashlib.sha256(str(data).encode()).hexdigest()[:16]
+        return _new_hash(str(data).encode()).hexdigest()[:16]
 
 
 def compute_merkle_root(hashes: List[str]) -> str:
     """
     Compute Merkle root from list of hashes.
-    
+
     Standard Merkle tree construction - pairs hashes bottom-up
-    until single root remains.
+    until single root remains. Each level is folded in a tight loop
+    over one working list, so an N-leaf tree costs N-1 hash calls and
+    no recursion or per-level list churn.
     """
     if not hashes:
-        return hashlib.sha256(b"empty").hexdigest()[:16]
-    
-    if len(hashes) == 1:
-        return hashes[0]
-    
-    # Pad to even length
-    if len(hashes) % 2 == 1:
-        hashes = hashes + [hashes[-1]]
-    
-    # Compute next level
-    next_level = []
-    for i in range(0, len(hashes), 2):
-        combined = hashes[i] + hashes[i + 1]
-        next_hash = hashlib.sha256(combined.encode()).hexdigest()[:16]
-        next_level.append(next_hash)
-    
-    return compute_merkle_root(next_level)
+        return _new_hash(b"empty").hexdigest()[:16]
+
+    hasher = _new_hash  # Local binding for the hot loop
+    level = list(hashes)
+    while len(level) > 1:
+        # Pad to even length
+        if len(level) % 2 == 1:
+            level.append(level[-1])
+        level = [
+            hasher((level[i] + level[i + 1]).encode()).hexdigest()[:16]
+            for i in range(0, len(level), 2)
+        ]
+    return level[0]
+
+
+class MerkleAccumulator:
+    """
+    Incremental Merkle root over a stream of hashes.
+
+    compute_merkle_root() rebuilds the whole tree from its leaf list,
+    which is O(N) per call. This accumulator keeps one pending hash per
+    tree level, so each append() costs O(log N) and root() folds the
+    pending levels with the same duplicate-last padding as
+    compute_merkle_root - the two always agree for the same leaves:
+
+        acc = MerkleAccumulator()
+        for h in hashes:
+            acc.append(h)
+        assert acc.root() == compute_merkle_root(hashes)
+
+    Useful when leaves stream in (e.g. records appended to a live
+    chain) and the current root is wanted after each one.
+    """
+
+    def __init__(self, hashes: Optional[List[str]] = None):
+        self._pending: List[Optional[str]] = []  # One slot per level
+        self._counts: List[int] = []             # Elements seen per level
+        self._count = 0
+        for h in hashes or ():
+            self.append(h)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, leaf: str) -> None:
+        """Add a leaf hash; completed pairs propagate upward."""
+        self._count += 1
+        carry = leaf
+        level = 0
+        while True:
+            if level == len(self._pending):
+                self._pending.append(None)
+                self._counts.append(0)
+            self._counts[level] += 1
+            if self._pending[level] is None:
+                self._pending[level] = carry
+                return
+            pair = self._pending[level] + carry
+            self._pending[level] = None
+            carry = _new_hash(pair.encode()).hexdigest()[:16]
+            level += 1
+
+    def root(self) -> str:
+        """Current Merkle root; the accumulator stays appendable."""
+        if self._count == 0:
+            return _new_hash(b"empty").hexdigest()[:16]
+
+        hasher = _new_hash
+        carry = None
+        for level, pending in enumerate(self._pending):
+            if pending is not None and carry is not None:
+                # Pending came first in stream order; carry closes the pair
+                carry = hasher((pending + carry).encode()).hexdigest()[:16]
+            elif pending is not None:
+                if self._counts[level] == 1:
+                    # Sole element of its level - promotes unhashed,
+                    # matching the single-hash base case
+                    carry = pending
+                else:
+                    # Odd tail of a wider level - duplicate-last padding
+                    carry = hasher((pending + pending).encode()).hexdigest()[:16]
+            elif carry is not None and self._counts[level] // 2 > 0:
+                # Carry lands after this level's paired elements: odd
+                # count, so it pairs with itself
+                carry = hasher((carry + carry).encode()).hexdigest()[:16]
+        return carry
 
 
 # =============================================================================
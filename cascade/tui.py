@@ -18,13 +18,25 @@ Features:
 
 from __future__ import annotations
 
+import os
 import sys
+import json
 import inspect
-import importlib
+import importlib.util
+import marshal
+import re
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set, Tuple
-from dataclasses import dataclass, field
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from types import MappingProxyType
+from collections.abc import Mapping
+from typing import NamedTuple
+from enum import IntFlag, auto
+
+import numpy as np
 
 from textual import on, work
 from textual.app import App, ComposeResult
@@ -42,105 +54,253 @@ from textual.reactive import reactive
 from textual.message import Message
 from textual.css.query import NoMatches
 
+from rich.console import Group, RenderableType
 from rich.text import Text
 from rich.table import Table
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.markdown import Markdown as RichMarkdown
+from pygments.lexers import get_lexer_by_name
 
 
 # ═══════════════════════════════════════════════════════════════
 # MODULE GRAPH - Maps relationships between modules
 # ═══════════════════════════════════════════════════════════════
 
-@dataclass
-class ModuleNode:
-    """A node in the module graph."""
+# Per-node documentation lives in markdown files next to this module so
+# import doesn't pay for multi-KB string literals the user may never open.
+_DOCS_DIR = Path(__file__).parent / "tui_docs"
+
+
+@lru_cache(maxsize=None)
+def _load_doc(full_path: str, mode: str) -> str:
+    """Read (and cache) a node's doc markdown on first access."""
+    try:
+        return (_DOCS_DIR / f"{full_path}.{mode}.md").read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+@lru_cache(maxsize=256)
+def _module_source(full_path: str) -> str:
+    """Source text of a module, fetched without importing it.
+
+    `find_spec` resolves the file path from the import system's caches;
+    reading the file directly avoids executing the module's top-level
+    code (and its import side-effects) just to display it.
+    """
+    try:
+        spec = importlib.util.find_spec(full_path)
+    except (ImportError, ValueError):
+        return ""
+    if spec is None or not spec.origin or spec.origin == "built-in":
+        return ""
+    try:
+        return Path(spec.origin).read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+# One lexer + resolved theme shared by every code pane; constructing
+# these per render re-resolves the Pygments style each time.
+_PYTHON_LEXER = get_lexer_by_name("python")
+_SYNTAX_THEME = Syntax.get_theme("monokai")
+
+
+def _make_syntax(code: str) -> Syntax:
+    """Highlighted code block using the shared lexer/theme."""
+    return Syntax(code, _PYTHON_LEXER, theme=_SYNTAX_THEME, line_numbers=True)
+
+
+@lru_cache(maxsize=64)
+def _module_syntax(full_path: str) -> Syntax:
+    """Syntax-highlighted source for a module, built once per module."""
+    source = _module_source(full_path) or f"# source unavailable: {full_path}"
+    return _make_syntax(source)
+
+
+# Untagged ``` fences in the docs are ASCII-art diagrams (architecture
+# boxes, state machines) - language-tagged ones are real code blocks.
+# Fences alternate open/close, so the split below tracks state line by
+# line; a bare ``` that closes a tagged block is not a diagram opener.
+_FENCE_LINE = re.compile(r"^```(\w*)[ \t]*$")
+
+
+@lru_cache(maxsize=None)
+def _doc_renderable(full_path: str, mode: str) -> RenderableType:
+    """Renderable for a node's docs: Markdown with pre-built diagrams.
+
+    ASCII diagrams are spliced out into plain Panel(Text) renderables so
+    repaints don't push multi-KB art through the markdown code-block
+    renderer; the surrounding prose stays Markdown. The whole group is
+    cached, so revisiting a node costs a dict hit, not a re-parse.
+    """
+    md = _load_doc(full_path, mode)
+    parts: list[RenderableType] = []
+    prose: list[str] = []
+    diagram: list[str] | None = None  # lines of the open untagged block
+    in_tagged = False
+    for line in md.splitlines():
+        fence = _FENCE_LINE.match(line)
+        if diagram is not None:
+            if fence:
+                parts_text = "\n".join(diagram)
+                if prose and "".join(prose).strip():
+                    parts.append(RichMarkdown("\n".join(prose)))
+                prose = []
+                parts.append(Panel(Text(parts_text), border_style="dim"))
+                diagram = None
+            else:
+                diagram.append(line)
+        elif in_tagged:
+            prose.append(line)
+            if fence:
+                in_tagged = False
+        elif fence:
+            if fence.group(1):
+                prose.append(line)
+                in_tagged = True
+            else:
+                diagram = []
+        else:
+            prose.append(line)
+    if diagram is not None:
+        # Unterminated fence: keep the content as prose rather than guess
+        prose.extend(["```", *diagram])
+    if (prose and "".join(prose).strip()) or not parts:
+        parts.append(RichMarkdown("\n".join(prose)))
+    if len(parts) == 1:
+        return parts[0]
+    return Group(*parts)
+
+
+class Category(IntFlag):
+    """Module categories as bit flags.
+
+    A set of active categories is a single int mask, and "is this node
+    visible?" is `node.category & mask` - one AND instead of a string
+    compare per node.
+    """
+    CORE = auto()
+    HOLD = auto()
+    STORE = auto()
+    GENESIS = auto()
+    VIZ = auto()
+    DIAGNOSTICS = auto()
+    FORENSICS = auto()
+    ROOT = auto()
+
+    @property
+    def label(self) -> str:
+        """Lowercase display name (what the old string field held)."""
+        return self.name.lower()
+
+
+# Node icons in one table instead of a string field per literal - one
+# place to edit, no per-instance storage, looked up by node path.
+_DEFAULT_ICON = "📦"
+
+# Category badge colors, shared by every card render. Styles are
+# pre-concatenated so render paths never rebuild "bold <color>" strings.
+_CAT_COLORS: dict[Category, str] = {
+    Category.ROOT: "magenta",
+    Category.CORE: "blue",
+    Category.HOLD: "yellow",
+    Category.STORE: "green",
+    Category.GENESIS: "red",
+    Category.VIZ: "cyan",
+    Category.DIAGNOSTICS: "orange1",
+    Category.FORENSICS: "purple",
+}
+_CAT_STYLE: dict[Category, str] = {cat: f"bold {color}" for cat, color in _CAT_COLORS.items()}
+ICONS: dict[str, str] = {
+    "cascade_lattice": "🌐",
+    "cascade_lattice.core": "⚙️",
+    "cascade_lattice.core.event": "📊",
+    "cascade_lattice.core.graph": "🕸️",
+    "cascade_lattice.core.provenance": "🔐",
+    "cascade_lattice.core.adapter": "🤝",
+    "cascade_lattice.hold": "⏸️",
+    "cascade_lattice.hold.primitives": "🧱",
+    "cascade_lattice.hold.session": "🎮",
+    "cascade_lattice.store": "💾",
+    "cascade_lattice.genesis": "🌅",
+    "cascade_lattice.viz": "🎬",
+    "cascade_lattice.diagnostics": "🔬",
+    "cascade_lattice.forensics": "🔎",
+    "cascade_lattice.listen": "👂",
+    "cascade_lattice.Monitor": "📡",
+}
+
+
+class ModuleNode(NamedTuple):
+    """A node in the module graph.
+
+    Immutable: the graph is constant at runtime, so nodes are plain
+    tuples - no per-instance __dict__, and attribute reads are C-level
+    slot lookups.
+    """
     name: str
     full_path: str
-    doc_dummy: str = ""      # Explanation for beginners
-    doc_scientist: str = ""  # Technical explanation
-    exports: List[str] = field(default_factory=list)
-    imports_from: List[str] = field(default_factory=list)
-    imported_by: List[str] = field(default_factory=list)
-    children: List[str] = field(default_factory=list)  # Sub-modules
-    parent: Optional[str] = None
-    category: str = "core"   # core, hold, store, viz, diagnostics, forensics
-    icon: str = "📦"
+    exports: tuple[str, ...] = ()
+    imports_from: tuple[str, ...] = ()
+    parent: str | None = None
+    category: Category = Category.CORE
+
+    @property
+    def icon(self) -> str:
+        """Display icon, resolved from the shared ICONS table."""
+        return ICONS.get(self.full_path, _DEFAULT_ICON)
+
+    @property
+    def doc_dummy(self) -> str:
+        """Explanation for beginners (lazy-loaded from tui_docs/)."""
+        return _load_doc(self.full_path, "dummy")
+
+    @property
+    def doc_scientist(self) -> str:
+        """Technical explanation (lazy-loaded from tui_docs/)."""
+        return _load_doc(self.full_path, "scientist")
+
+
+def _load_baked_graph() -> dict[str, ModuleNode] | None:
+    """Fast path: load nodes pre-baked offline by tools/bake_graph.py.
+
+    The baked module holds one marshal blob instead of ~16 keyword-heavy
+    constructor calls, so startup skips executing the literal below.
+    The hand-written literal stays the source of truth; the baked file
+    is an optional build artifact and absence is normal.
+    """
+    if os.environ.get("CASCADE_TUI_NO_BAKE"):
+        return None
+    try:
+        from cascade._graph_baked import BAKED_GRAPH
+    except ImportError:
+        return None
+    try:
+        rows = marshal.loads(BAKED_GRAPH)
+        return {
+            key: ModuleNode(name, full_path, exports, imports_from,
+                            parent, Category(category))
+            for key, name, full_path, exports, imports_from,
+                parent, category in rows
+        }
+    except (ValueError, TypeError):
+        return None
 
 
 # The module graph - hand-crafted with love
-MODULE_GRAPH: Dict[str, ModuleNode] = {
+_MODULE_GRAPH: dict[str, ModuleNode] = _load_baked_graph() or {
     # ═══════════════════════════════════════════════════════════
     # ROOT
     # ═══════════════════════════════════════════════════════════
     "cascade_lattice": ModuleNode(
         name="cascade_lattice",
         full_path="cascade_lattice",
-        icon="🌐",
-        category="root",
-        doc_dummy="""
-# 🌐 CASCADE-LATTICE
-
-**What is this?** Think of it as a "receipt printer" for AI decisions.
-
-Every time an AI makes a choice, cascade-lattice writes it down with a 
-cryptographic signature. Like getting a receipt at a store - you can 
-prove what happened, when, and trace it back to the source.
-
-**Why does this matter?**
-- 🔍 **Transparency**: See exactly what your AI did
-- 🛡️ **Safety**: Humans can pause and review decisions (HOLD)
-- 📜 **Provenance**: Trace any output back to its origins
-- 🔗 **Integrity**: Cryptographic proofs prevent tampering
-
-**The Genesis Block**: Everything traces back to one root hash.
-Like the first block in a blockchain, but for AI decisions.
-        """,
-        doc_scientist="""
-# CASCADE-LATTICE: Universal AI Provenance Layer
-
-A content-addressed, Merkle-authenticated observation framework implementing 
-the HOLD protocol for human-in-the-loop inference control.
-
-## Architecture
-
-```
-                    ┌─────────────────┐
-                    │  Genesis Root   │
-                    │  89f940c1a4b7   │
-                    └────────┬────────┘
-                             │
-        ┌────────────────────┼────────────────────┐
-        ▼                    ▼                    ▼
-   ┌─────────┐         ┌─────────┐         ┌─────────┐
-   │ Receipt │         │ Receipt │         │ Receipt │
-   │ CID: baf│         │ CID: baf│         │ CID: baf│
-   └─────────┘         └─────────┘         └─────────┘
-```
-
-## Key Concepts
-
-- **CID**: Content Identifier (IPFS CIDv1, dag-cbor codec)
-- **Merkle Root**: SHA-256 hash chain for integrity verification
-- **HoldPoint**: Freeze-frame of model state for human inspection
-- **SymbioticAdapter**: Kleene fixed-point signal normalization
-- **ProvenanceChain**: Linked list of cryptographic attestations
-
-## Module Hierarchy
-
-- `core/`: Event, Graph, Provenance, Adapter primitives
-- `hold/`: HOLD protocol implementation (pause/inspect/override)
-- `store`: SQLite + IPFS + HuggingFace persistence
-- `genesis`: Root provenance chain creation
-- `viz/`: Tape recording and playback
-- `diagnostics/`: Bug detection, execution monitoring
-- `forensics/`: Data archaeology, tech fingerprinting
-        """,
-        exports=["Hold", "HoldPoint", "HoldState", "HoldResolution", "Receipt", 
+        category=Category.ROOT,
+        exports=("Hold", "HoldPoint", "HoldState", "HoldResolution", "Receipt", 
                  "Monitor", "SymbioticAdapter", "CausationGraph", "genesis", 
-                 "observe", "store", "viz", "diagnostics", "forensics"],
-        children=["core", "hold", "store", "genesis", "viz", "diagnostics", "forensics"],
+                 "observe", "store", "viz", "diagnostics", "forensics",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -149,308 +309,47 @@ the HOLD protocol for human-in-the-loop inference control.
     "core": ModuleNode(
         name="core",
         full_path="cascade_lattice.core",
-        icon="⚙️",
-        category="core",
+        category=Category.CORE,
         parent="cascade_lattice",
-        doc_dummy="""
-# ⚙️ Core Module
-
-**What is this?** The engine room of cascade-lattice.
-
-Think of it like the foundation of a house - you don't see it, 
-but everything else is built on top of it.
-
-**What's inside:**
-- 📊 **Event**: A single "thing that happened" 
-- 🔗 **Graph**: How events connect to each other
-- 🔐 **Provenance**: The chain of custody (who touched what, when)
-- 🤝 **Adapter**: Translates between different signal formats
-        """,
-        doc_scientist="""
-# Core Module (`cascade.core`)
-
-Foundational primitives for the observation framework.
-
-## Components
-
-### Event (`core.event`)
-```python
-@dataclass
-class Event:
-    timestamp: float
-    component: str
-    event_type: str
-    data: Dict[str, Any]
-    event_id: str  # Auto-generated UUID
-```
-
-### CausationGraph (`core.graph`)
-Directed acyclic graph for causal relationship tracking.
-- `add_event(event)` → Register event node
-- `add_link(cause_id, effect_id, strength)` → Causal edge
-- `find_path(start, end)` → Shortest causal path
-- `get_root_events()` → Events with no causes
-
-### ProvenanceChain (`core.provenance`)
-Merkle-authenticated chain of records.
-- `add_record(input_hash, output_hash, model_hash)`
-- `verify()` → Validate chain integrity
-- `get_lineage()` → Full audit trail
-
-### SymbioticAdapter (`core.adapter`)
-Kleene fixed-point signal interpreter.
-- `interpret(signal)` → Normalize ANY format to Event
-- `learned_patterns` → Discovered signal structures
-        """,
-        exports=["Event", "CausationGraph", "ProvenanceChain", "ProvenanceRecord",
-                 "SymbioticAdapter", "compute_merkle_root", "hash_tensor"],
-        children=["event", "graph", "provenance", "adapter"],
-        imported_by=["hold", "store", "genesis", "diagnostics"],
+        exports=("Event", "CausationGraph", "ProvenanceChain", "ProvenanceRecord",
+                 "SymbioticAdapter", "compute_merkle_root", "hash_tensor",),
     ),
     
     "event": ModuleNode(
         name="event",
         full_path="cascade_lattice.core.event",
-        icon="📊",
-        category="core",
+        category=Category.CORE,
         parent="core",
-        doc_dummy="""
-# 📊 Event
-
-**What is this?** A snapshot of "something happened."
-
-Like a diary entry: "At 3:42pm, the AI looked at a cat picture 
-and decided it was 90% cat, 10% loaf of bread."
-
-**Key parts:**
-- ⏰ **timestamp**: When did it happen?
-- 🏷️ **event_type**: What kind of thing? (decision, observation, error)
-- 📝 **data**: The actual details
-- 🆔 **event_id**: Unique fingerprint for this exact moment
-        """,
-        doc_scientist="""
-# Event (`cascade.core.event`)
-
-Immutable record of a discrete system occurrence.
-
-```python
-@dataclass
-class Event:
-    timestamp: float          # Unix epoch (time.time())
-    component: str            # Source subsystem identifier
-    event_type: str           # Taxonomy: state_change, decision, observation
-    data: Dict[str, Any]      # Arbitrary payload (JSON-serializable)
-    event_id: str             # UUID v4, auto-generated
-    source_signal: Any = None # Original input before normalization
-    
-    def to_dict(self) -> Dict[str, Any]: ...
-    @classmethod
-    def from_dict(cls, d: Dict) -> 'Event': ...
-```
-
-## Event Types
-- `state_change`: Internal state mutation
-- `decision`: Action selection with confidence
-- `observation`: External input processing
-- `hold_point`: HITL pause trigger
-- `resolution`: Human decision on hold
-        """,
-        exports=["Event"],
-        imports_from=["provenance"],
-        imported_by=["graph", "adapter", "hold.primitives"],
+        exports=("Event",),
+        imports_from=("provenance",),
     ),
     
     "graph": ModuleNode(
         name="graph",
         full_path="cascade_lattice.core.graph",
-        icon="🕸️",
-        category="core",
+        category=Category.CORE,
         parent="core",
-        doc_dummy="""
-# 🕸️ Causation Graph
-
-**What is this?** A map of cause and effect.
-
-Imagine a detective's board with photos connected by red string.
-"This event CAUSED that event." You can trace backwards to find
-the root cause of anything.
-
-**What can you do:**
-- 🔍 **Trace backwards**: "What caused this bug?"
-- ➡️ **Trace forwards**: "What did this decision affect?"
-- 🌳 **Find roots**: "Where did it all begin?"
-- 📏 **Find paths**: "How are these two events connected?"
-        """,
-        doc_scientist="""
-# CausationGraph (`cascade.core.graph`)
-
-DAG-based causal relationship tracker with temporal ordering.
-
-```python
-class CausationGraph:
-    def add_event(self, event: Event) -> str: ...
-    def add_link(self, cause_id: str, effect_id: str, 
-                 strength: float = 1.0) -> None: ...
-    def get_causes(self, event_id: str) -> List[Event]: ...
-    def get_effects(self, event_id: str) -> List[Event]: ...
-    def find_path(self, start_id: str, end_id: str) -> List[str]: ...
-    def get_root_events(self) -> List[Event]: ...
-    def get_terminal_events(self) -> List[Event]: ...
-    def compute_impact(self, event_id: str) -> float: ...
-```
-
-## Link Semantics
-- `strength ∈ [0, 1]`: Causal contribution weight
-- Multiple causes: `Σ strength_i` need not equal 1
-- Temporal constraint: `cause.timestamp < effect.timestamp`
-
-## Traversal
-- BFS for shortest path
-- DFS for exhaustive impact analysis
-- Topological sort for execution order
-        """,
-        exports=["CausationGraph", "CausationChain"],
-        imports_from=["event"],
-        imported_by=["diagnostics", "monitor"],
+        exports=("CausationGraph", "CausationChain",),
+        imports_from=("event",),
     ),
     
     "provenance": ModuleNode(
         name="provenance",
         full_path="cascade_lattice.core.provenance",
-        icon="🔐",
-        category="core",
+        category=Category.CORE,
         parent="core",
-        doc_dummy="""
-# 🔐 Provenance
-
-**What is this?** A chain of custody for AI decisions.
-
-Like evidence in a courtroom - you need to prove the evidence 
-wasn't tampered with. Provenance creates a cryptographic trail
-that proves: "This output really came from this input through 
-this model, and nobody messed with it."
-
-**Key functions:**
-- 🧮 **hash_tensor**: Fingerprint a neural network's weights
-- 📝 **hash_input**: Fingerprint what went in
-- 🔗 **compute_merkle_root**: Combine all fingerprints into one
-- ✅ **verify_chain**: Check if anything was tampered with
-        """,
-        doc_scientist="""
-# Provenance (`cascade.core.provenance`)
-
-Merkle-authenticated provenance tracking with cryptographic verification.
-
-```python
-def hash_tensor(tensor: np.ndarray) -> str:
-    '''SHA-256 of normalized tensor bytes (first 16 hex chars)'''
-
-def hash_params(module: nn.Module) -> str:
-    '''Hash all named_parameters recursively'''
-
-def hash_input(data: Any) -> str:
-    '''JSON-serialize then hash'''
-
-def compute_merkle_root(hashes: List[str]) -> str:
-    '''Binary tree Merkle root computation'''
-
-@dataclass
-class ProvenanceRecord:
-    input_hash: str
-    output_hash: str
-    model_hash: str
-    timestamp: float
-    parent_merkle: Optional[str]
-    merkle_root: str  # Computed from above fields
-    
-@dataclass
-class ProvenanceChain:
-    model_id: str
-    session_id: str
-    records: List[ProvenanceRecord]
-    merkle_root: str
-    
-    def add_record(self, input_h, output_h, model_h) -> ProvenanceRecord: ...
-    def verify(self) -> bool: ...
-    def get_lineage(self) -> List[ProvenanceRecord]: ...
-```
-
-## Merkle Tree Structure
-```
-        root
-       /    \\
-     h01    h23
-    /  \\   /  \\
-   h0  h1 h2  h3
-```
-        """,
-        exports=["ProvenanceChain", "ProvenanceRecord", "ProvenanceTracker",
+        exports=("ProvenanceChain", "ProvenanceRecord", "ProvenanceTracker",
                  "compute_merkle_root", "hash_tensor", "hash_params", 
-                 "hash_input", "hash_model", "verify_chain"],
-        imported_by=["genesis", "store", "hold.primitives"],
+                 "hash_input", "hash_model", "verify_chain",),
     ),
     
     "adapter": ModuleNode(
         name="adapter",
         full_path="cascade_lattice.core.adapter",
-        icon="🤝",
-        category="core",
+        category=Category.CORE,
         parent="core",
-        doc_dummy="""
-# 🤝 Symbiotic Adapter
-
-**What is this?** A universal translator for AI signals.
-
-Different AI models speak different languages - some output 
-dictionaries, some output numpy arrays, some output raw text.
-The adapter learns to understand ANY format and converts it 
-to a standard Event.
-
-**Think of it like:** Google Translate, but for AI outputs.
-
-**Magic feature:** It learns patterns as it sees more signals!
-        """,
-        doc_scientist="""
-# SymbioticAdapter (`cascade.core.adapter`)
-
-Kleene fixed-point signal normalizer implementing universal interpretation.
-
-```python
-class SymbioticAdapter:
-    def __init__(self): 
-        self._patterns: List[SignalPattern] = []
-        self._signal_count: int = 0
-    
-    def interpret(self, signal: Any) -> Event:
-        '''
-        Fixed-point iteration:
-        1. Try known patterns in order
-        2. If match, extract structured data
-        3. If no match, create raw_message wrapper
-        4. Learn new pattern if structure detected
-        '''
-    
-    @property
-    def signal_count(self) -> int: ...
-    
-    @property 
-    def learned_patterns(self) -> List[str]: ...
-```
-
-## Pattern Learning
-- Dict with 'embedding' key → vector extraction
-- Dict with 'action'/'reward' → RL transition
-- numpy.ndarray → tensor observation
-- str → raw message wrapper
-
-## Kleene Semantics
-Interpretation reaches fixed-point when:
-- Pattern matching stabilizes
-- No new patterns discovered in N signals
-        """,
-        exports=["SymbioticAdapter", "SignalPattern"],
-        imports_from=["event"],
-        imported_by=["monitor", "hold.session"],
+        exports=("SymbioticAdapter", "SignalPattern",),
+        imports_from=("event",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -459,222 +358,28 @@ Interpretation reaches fixed-point when:
     "hold": ModuleNode(
         name="hold",
         full_path="cascade_lattice.hold",
-        icon="⏸️",
-        category="hold",
+        category=Category.HOLD,
         parent="cascade_lattice",
-        doc_dummy="""
-# ⏸️ HOLD - Human-in-the-Loop
-
-**What is this?** A pause button for AI decisions.
-
-Before the AI acts, HOLD freezes everything and asks:
-"Hey human, here's what I'm about to do. Is this okay?"
-
-**You can:**
-- ✅ **Accept**: "Yes, do it"
-- ✏️ **Override**: "No, do THIS instead"
-- ❌ **Cancel**: "Stop everything"
-- ⏰ **Timeout**: If you don't respond, a default happens
-
-**Why is this important?** 
-It's the "11th man" - the human who has final say over AI decisions.
-        """,
-        doc_scientist="""
-# HOLD Protocol (`cascade.hold`)
-
-Human-in-the-loop inference control implementing freeze-frame inspection.
-
-## Architecture
-```
-Model Forward Pass
-       │
-       ▼
-   ┌───────────┐
-   │ HoldPoint │◄─── Freeze state
-   └─────┬─────┘
-         │
-    ┌────┴────┐
-    │ PENDING │
-    └────┬────┘
-         │
-   ┌─────┴─────┐
-   │  Human    │
-   │ Decision  │
-   └─────┬─────┘
-         │
-    ┌────┴────┐        ┌────────────┐
-    │ACCEPTED │   or   │ OVERRIDDEN │
-    └─────────┘        └────────────┘
-```
-
-## State Machine
-```
-PENDING ──accept()──► ACCEPTED
-   │
-   ├──override()──► OVERRIDDEN
-   │
-   ├──cancel()──► CANCELLED
-   │
-   └──timeout()──► TIMEOUT
-```
-
-## Key Classes
-- `Hold`: Singleton controller, manages yield_point flow
-- `HoldPoint`: Immutable snapshot with merkle_root
-- `HoldResolution`: Result of human decision
-- `HoldState`: Enum of possible states
-        """,
-        exports=["Hold", "HoldPoint", "HoldResolution", "HoldState", "HoldAwareMixin"],
-        children=["hold.primitives", "hold.session"],
-        imports_from=["core.event", "core.provenance"],
-        imported_by=["store", "viz"],
+        exports=("Hold", "HoldPoint", "HoldResolution", "HoldState", "HoldAwareMixin",),
+        imports_from=("core.event", "core.provenance",),
     ),
     
     "hold.primitives": ModuleNode(
         name="primitives",
         full_path="cascade_lattice.hold.primitives",
-        icon="🧱",
-        category="hold",
+        category=Category.HOLD,
         parent="hold",
-        doc_dummy="""
-# 🧱 Hold Primitives
-
-**What is this?** The building blocks of HOLD.
-
-- **HoldPoint**: A freeze-frame snapshot
-  - What action was the AI going to take?
-  - How confident was it?
-  - What was it looking at?
-  
-- **HoldState**: Is it waiting? Approved? Overridden?
-
-- **HoldResolution**: What did the human decide?
-        """,
-        doc_scientist="""
-# Hold Primitives (`cascade.hold.primitives`)
-
-Core data structures for the HOLD protocol.
-
-```python
-class HoldState(Enum):
-    PENDING = 'pending'
-    ACCEPTED = 'accepted'
-    OVERRIDDEN = 'overridden'
-    TIMEOUT = 'timeout'
-    CANCELLED = 'cancelled'
-
-@dataclass
-class HoldPoint:
-    action_probs: np.ndarray      # Softmax distribution
-    value: float                   # V(s) estimate
-    observation: Any               # Input state
-    brain_id: str                  # Source model identifier
-    action_labels: List[str] = None
-    latent: np.ndarray = None      # Hidden state
-    attention: np.ndarray = None   # Attention weights
-    features: Dict = None          # Arbitrary display data
-    imagination: Any = None        # World model prediction
-    logits: np.ndarray = None      # Pre-softmax scores
-    reasoning: str = None          # CoT trace
-    world_prediction: Any = None   # Future state prediction
-    
-    # Auto-computed
-    id: str                        # UUID
-    timestamp: float               # Creation time
-    parent_merkle: str = None      # Chain linkage
-    merkle_root: str               # Integrity hash
-    state: HoldState = PENDING
-
-@dataclass
-class HoldResolution:
-    action: int                    # Selected action index
-    was_override: bool             # Human changed it?
-    override_source: str = None    # Who overrode?
-    hold_duration: float           # Seconds in PENDING
-    notes: str = None              # Human annotation
-```
-        """,
-        exports=["HoldPoint", "HoldState", "HoldResolution"],
-        imports_from=["core.provenance"],
-        imported_by=["hold.session", "viz.tape"],
+        exports=("HoldPoint", "HoldState", "HoldResolution",),
+        imports_from=("core.provenance",),
     ),
     
     "hold.session": ModuleNode(
         name="session",
         full_path="cascade_lattice.hold.session",
-        icon="🎮",
-        category="hold",
+        category=Category.HOLD,
         parent="hold",
-        doc_dummy="""
-# 🎮 Hold Session
-
-**What is this?** The controller that manages HOLD pauses.
-
-It's like a game pause menu:
-- Press pause (yield_point)
-- Game freezes
-- You make a choice
-- Game resumes
-
-**Key actions:**
-- `yield_point()`: Pause and wait for human
-- `accept()`: Resume with AI's choice
-- `override()`: Resume with human's choice
-- `cancel()`: Abort entirely
-        """,
-        doc_scientist="""
-# Hold Session (`cascade.hold.session`)
-
-Singleton-pattern HOLD controller with listener registration.
-
-```python
-class Hold:
-    _instance: 'Hold' = None  # Singleton
-    
-    def __new__(cls) -> 'Hold':
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    def yield_point(
-        self,
-        action_probs: np.ndarray,
-        value: float,
-        observation: Any,
-        brain_id: str,
-        blocking: bool = True,
-        **kwargs
-    ) -> Optional[HoldResolution]:
-        '''
-        Create HoldPoint, notify listeners, optionally block.
-        Returns HoldResolution when resolved.
-        '''
-    
-    def accept(self, action: int = None) -> HoldResolution: ...
-    def override(self, action: int, source: str) -> HoldResolution: ...
-    def cancel(self) -> None: ...
-    def register_listener(self, callback: Callable) -> None: ...
-    def current_hold(self) -> Optional[HoldPoint]: ...
-    
-    @property
-    def auto_accept(self) -> bool: ...
-    @property
-    def timeout(self) -> float: ...
-    def stats(self) -> Dict[str, Any]: ...
-```
-
-## Listener Pattern
-```python
-def my_listener(hold_point: HoldPoint):
-    print(f"Received: {hold_point.id}")
-    # Inspect, then call Hold().accept() or override()
-
-Hold().register_listener(my_listener)
-```
-        """,
-        exports=["Hold", "HoldAwareMixin"],
-        imports_from=["hold.primitives", "core.adapter"],
-        imported_by=["store", "brain"],
+        exports=("Hold", "HoldAwareMixin",),
+        imports_from=("hold.primitives", "core.adapter",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -683,76 +388,11 @@ Hold().register_listener(my_listener)
     "store": ModuleNode(
         name="store",
         full_path="cascade_lattice.store",
-        icon="💾",
-        category="store",
+        category=Category.STORE,
         parent="cascade_lattice",
-        doc_dummy="""
-# 💾 Store
-
-**What is this?** Where all the receipts are saved.
-
-Like a filing cabinet that:
-- 📁 **Saves locally**: SQLite database on your computer
-- ☁️ **Syncs to cloud**: HuggingFace datasets
-- 🌐 **Pins to IPFS**: Decentralized, permanent storage
-
-**Key functions:**
-- `observe()`: Save an observation and get a receipt
-- `query()`: Find observations by model name
-- `stats()`: How many observations do I have?
-        """,
-        doc_scientist="""
-# Store (`cascade.store`)
-
-Multi-tier persistence layer: Local SQLite → HuggingFace → IPFS.
-
-```python
-# Configuration
-CENTRAL_DATASET = "tostido/cascade-observations"
-DEFAULT_LATTICE_DIR = Path.home() / ".cascade" / "lattice"
-IPFS_GATEWAYS = [
-    'https://ipfs.io/ipfs/',
-    'https://dweb.link/ipfs/',
-    'https://gateway.pinata.cloud/ipfs/'
-]
-
-@dataclass
-class Receipt:
-    cid: str              # IPFS CIDv1 (dag-cbor)
-    model_id: str         # Source model identifier
-    merkle_root: str      # Chain integrity hash
-    timestamp: float      # Unix epoch
-    data: Dict[str, Any]  # Original observation
-    parent_cid: str = None
-
-class LocalStore:
-    def __init__(self, lattice_dir: Path = None): ...
-    def save(self, receipt: Receipt) -> None: ...
-    def get(self, cid: str) -> Optional[Receipt]: ...
-    def get_latest(self, model_id: str) -> Optional[Receipt]: ...
-    def query(self, model_id: str, limit: int = 100) -> List[Receipt]: ...
-    def count(self) -> int: ...
-
-# Top-level functions
-def observe(model_id: str, data: Dict, parent_cid: str = None, 
-            sync: bool = True) -> Receipt: ...
-def query(model_id: str, limit: int = 100) -> List[Receipt]: ...
-def stats() -> Dict[str, Any]: ...
-def sync_all() -> None: ...
-```
-
-## CID Computation (dag-cbor)
-```python
-def data_to_cid(data: Dict) -> Tuple[str, bytes]:
-    cbor_bytes = dag_cbor.encode(data)
-    digest = multihash.digest(cbor_bytes, 'sha2-256')
-    return CID('base32', 1, 'dag-cbor', digest).encode(), cbor_bytes
-```
-        """,
-        exports=["Receipt", "LocalStore", "observe", "query", "stats", 
-                 "sync_all", "compute_cid", "data_to_cid", "fetch_receipt"],
-        imports_from=["core.provenance", "genesis"],
-        imported_by=["hold.session", "viz"],
+        exports=("Receipt", "LocalStore", "observe", "query", "stats", 
+                 "sync_all", "compute_cid", "data_to_cid", "fetch_receipt",),
+        imports_from=("core.provenance", "genesis",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -761,83 +401,11 @@ def data_to_cid(data: Dict) -> Tuple[str, bytes]:
     "genesis": ModuleNode(
         name="genesis",
         full_path="cascade_lattice.genesis",
-        icon="🌅",
-        category="genesis",
+        category=Category.GENESIS,
         parent="cascade_lattice",
-        doc_dummy="""
-# 🌅 Genesis
-
-**What is this?** The beginning of everything.
-
-Like the first page of a book, or the Big Bang of the universe.
-Every single observation in cascade-lattice can trace its lineage
-back to ONE root hash: the Genesis Block.
-
-**The Genesis Message:**
-> "In the beginning was the hash, and the hash was with the chain, 
->  and the hash was the chain."
-
-**Genesis Root:** `89f940c1a4b7aa65`
-
-This is your cryptographic anchor. If you can verify lineage to 
-genesis, you KNOW the data hasn't been tampered with.
-        """,
-        doc_scientist="""
-# Genesis (`cascade.genesis`)
-
-Root provenance anchor with deterministic initialization.
-
-```python
-GENESIS_INPUT = "In the beginning was the hash, and the hash was with the chain, and the hash was the chain."
-GENESIS_MODEL_ID = "cascade_genesis"
-GENESIS_SESSION_ID = "genesis_0"
-
-def create_genesis() -> ProvenanceChain:
-    '''
-    Create the root provenance chain.
-    Deterministic: always produces merkle_root = 89f940c1a4b7aa65
-    '''
-
-def get_genesis_root() -> str:
-    '''Return the canonical genesis merkle root'''
-    return "89f940c1a4b7aa65"
-
-def verify_lineage_to_genesis(
-    chain: ProvenanceChain, 
-    known_chains: Dict[str, ProvenanceChain]
-) -> bool:
-    '''
-    Verify that a chain can trace its lineage to genesis.
-    Walks external_roots until genesis is reached.
-    '''
-
-def link_to_genesis(chain: ProvenanceChain) -> ProvenanceChain:
-    '''Add genesis as external root'''
-
-def save_genesis(path: Path) -> None: ...
-def load_genesis(path: Path) -> ProvenanceChain: ...
-```
-
-## Genesis Chain Structure
-```json
-{
-  "model_id": "cascade_genesis",
-  "session_id": "genesis_0",
-  "merkle_root": "89f940c1a4b7aa65",
-  "finalized": true,
-  "records": [{
-    "input_hash": "<hash of GENESIS_INPUT>",
-    "output_hash": "<hash of GENESIS_INPUT>",
-    "model_hash": "<hash of 'genesis'>",
-    "merkle_root": "89f940c1a4b7aa65"
-  }]
-}
-```
-        """,
-        exports=["create_genesis", "get_genesis_root", "verify_lineage_to_genesis",
-                 "link_to_genesis", "ProvenanceChain", "GENESIS_INPUT"],
-        imports_from=["core.provenance"],
-        imported_by=["store"],
+        exports=("create_genesis", "get_genesis_root", "verify_lineage_to_genesis",
+                 "link_to_genesis", "ProvenanceChain", "GENESIS_INPUT",),
+        imports_from=("core.provenance",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -846,67 +414,11 @@ def load_genesis(path: Path) -> ProvenanceChain: ...
     "viz": ModuleNode(
         name="viz",
         full_path="cascade_lattice.viz",
-        icon="🎬",
-        category="viz",
+        category=Category.VIZ,
         parent="cascade_lattice",
-        doc_dummy="""
-# 🎬 Viz - Visualization
-
-**What is this?** A VCR for AI decisions.
-
-Record everything that happens, then play it back later.
-Like watching game replays, but for AI behavior.
-
-**Features:**
-- 📼 **Tape**: Record events to a file
-- ⏪ **Playback**: Scrub through history
-- 🔍 **Inspection**: See exactly what happened at any moment
-        """,
-        doc_scientist="""
-# Viz (`cascade.viz`)
-
-Event tape recording and playback for debugging and analysis.
-
-```python
-# Tape I/O
-def create_tape_path(prefix: str = "tape") -> str:
-    '''Generate timestamped tape filename'''
-
-def write_tape_event(tape_path: str, event: Dict) -> None:
-    '''Append JSONL event to tape file'''
-
-def load_tape_file(tape_path: str) -> List[Dict]:
-    '''Load all events from tape'''
-
-def list_tape_files(directory: str = ".") -> List[str]:
-    '''Find all tape files'''
-
-def find_latest_tape(directory: str = ".") -> Optional[str]:
-    '''Get most recent tape file'''
-
-@dataclass
-class PlaybackEvent:
-    timestamp: float
-    event_type: str
-    data: Dict[str, Any]
-
-@dataclass
-class PlaybackBuffer:
-    events: List[PlaybackEvent]
-    current_index: int = 0
-    is_complete: bool = False
-    
-    def add(self, event: PlaybackEvent) -> None: ...
-    def get_events_up_to(self, index: int) -> List[PlaybackEvent]: ...
-    
-    @classmethod
-    def from_tape(cls, tape_path: str) -> 'PlaybackBuffer': ...
-```
-        """,
-        exports=["PlaybackBuffer", "PlaybackEvent", "create_tape_path",
-                 "write_tape_event", "load_tape_file", "list_tape_files"],
-        children=["viz.tape"],
-        imports_from=["hold.primitives"],
+        exports=("PlaybackBuffer", "PlaybackEvent", "create_tape_path",
+                 "write_tape_event", "load_tape_file", "list_tape_files",),
+        imports_from=("hold.primitives",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -915,68 +427,11 @@ class PlaybackBuffer:
     "diagnostics": ModuleNode(
         name="diagnostics",
         full_path="cascade_lattice.diagnostics",
-        icon="🔬",
-        category="diagnostics",
+        category=Category.DIAGNOSTICS,
         parent="cascade_lattice",
-        doc_dummy="""
-# 🔬 Diagnostics
-
-**What is this?** A doctor for your code.
-
-It scans your code looking for problems, bugs, and weird patterns.
-Like a health checkup, but for software.
-
-**Tools:**
-- 🐛 **BugDetector**: Find common bug patterns
-- 🏥 **DiagnosticEngine**: Comprehensive code analysis
-- 📊 **ExecutionMonitor**: Watch code as it runs
-        """,
-        doc_scientist="""
-# Diagnostics (`cascade.diagnostics`)
-
-Static analysis, runtime monitoring, and bug pattern detection.
-
-```python
-class BugDetector:
-    def __init__(self): ...
-    def register_pattern(self, pattern: BugPattern) -> None: ...
-    def scan_file(self, path: Path) -> List[DetectedIssue]: ...
-    def scan_directory(self, path: Path) -> List[DetectedIssue]: ...
-    def get_summary(self) -> Dict[str, int]: ...
-    def get_report(self) -> DiagnosticReport: ...
-
-class DiagnosticEngine:
-    def analyze_file(self, path: Path) -> DiagnosticReport: ...
-    def analyze_directory(self, path: Path) -> DiagnosticReport: ...
-    def analyze_execution(self, trace: List[ExecutionFrame]) -> DiagnosticReport: ...
-    def to_markdown(self) -> str: ...
-
-class ExecutionMonitor:
-    def __init__(self): ...
-    def start(self) -> None: ...
-    def stop(self) -> List[ExecutionFrame]: ...
-    def get_hot_paths(self) -> List[Tuple[str, int]]: ...
-
-@dataclass
-class BugPattern:
-    name: str
-    regex: str
-    severity: str  # info, warning, error, critical
-    description: str
-    fix_suggestion: str
-
-@dataclass
-class DetectedIssue:
-    pattern: BugPattern
-    file: Path
-    line: int
-    context: str
-```
-        """,
-        exports=["BugDetector", "DiagnosticEngine", "ExecutionMonitor",
-                 "BugPattern", "BugSignature", "DetectedIssue", "DiagnosticReport"],
-        children=["diagnostics.bug_detector", "diagnostics.execution_monitor"],
-        imports_from=["core.graph"],
+        exports=("BugDetector", "DiagnosticEngine", "ExecutionMonitor",
+                 "BugPattern", "BugSignature", "DetectedIssue", "DiagnosticReport",),
+        imports_from=("core.graph",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -985,69 +440,10 @@ class DetectedIssue:
     "forensics": ModuleNode(
         name="forensics",
         full_path="cascade_lattice.forensics",
-        icon="🔎",
-        category="forensics",
+        category=Category.FORENSICS,
         parent="cascade_lattice",
-        doc_dummy="""
-# 🔎 Forensics
-
-**What is this?** Digital archaeology for data.
-
-When you find mysterious data, forensics helps you figure out:
-- 🕵️ What created this data?
-- 📅 When was it created?
-- 🔧 What tools/frameworks were used?
-- 🚨 Are there any security concerns?
-
-**Think of it like:** CSI for code and data.
-        """,
-        doc_scientist="""
-# Forensics (`cascade.forensics`)
-
-Data archaeology and tech stack fingerprinting.
-
-```python
-class DataForensics:
-    def analyze(self, data: Any, mode: str = "auto") -> ForensicsReport: ...
-    def analyze_file(self, path: Path, mode: str = "auto") -> ForensicsReport: ...
-
-class TechFingerprinter:
-    PATTERNS: Dict[str, str]  # tech_name → regex
-    COMPOUND_PATTERNS: Dict[str, List[str]]  # framework → components
-    
-    def analyze(self, text: str) -> List[Fingerprint]: ...
-    def get_likely_stack(self) -> List[str]: ...
-    def get_security_concerns(self) -> List[str]: ...
-
-class ArtifactDetector:
-    def detect_timestamps(self, data: Any) -> TimestampArtifacts: ...
-    def detect_ids(self, data: Any) -> IDPatternArtifacts: ...
-    def detect_schemas(self, data: Any) -> SchemaArtifacts: ...
-    def detect_text_patterns(self, text: str) -> TextArtifacts: ...
-    def detect_numeric_patterns(self, numbers: List) -> NumericArtifacts: ...
-
-@dataclass
-class Fingerprint:
-    tech: str
-    confidence: float
-    evidence: List[str]
-
-@dataclass
-class ForensicsReport:
-    fingerprints: List[Fingerprint]
-    artifacts: Dict[str, Any]
-    inferred_operations: List[InferredOperation]
-    ghost_logs: List[GhostLog]  # Traces of deleted data
-
-Modes:
-- "dataset" = archaeology on patterned datasets
-- "anomaly" = structured single-event / small-sample debug forensics
-- "auto" = choose based on input shape
-```
-        """,
-        exports=["DataForensics", "TechFingerprinter", "ArtifactDetector",
-                 "Fingerprint", "ForensicsReport", "GhostLog"],
-        children=["forensics.analyzer", "forensics.fingerprints", "forensics.artifacts"],
+        exports=("DataForensics", "TechFingerprinter", "ArtifactDetector",
+                 "Fingerprint", "ForensicsReport", "GhostLog",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -1056,45 +452,10 @@ Modes:
     "listen": ModuleNode(
         name="listen",
         full_path="cascade_lattice.listen",
-        icon="👂",
-        category="core",
+        category=Category.CORE,
         parent="cascade_lattice",
-        doc_dummy="""
-# 👂 Listen
-
-**What is this?** A passive observer for HOLD events.
-
-Like having a security camera that records everything without 
-interfering. Events flow through and you can watch them later.
-
-**The event_queue:** A line where events wait to be processed.
-        """,
-        doc_scientist="""
-# Listen (`cascade.listen`)
-
-Passive event monitoring via thread-safe queue.
-
-```python
-event_queue: Queue  # Thread-safe event queue
-
-def main():
-    '''CLI entry point for passive monitoring'''
-    monitor = Monitor("listener")
-    while True:
-        try:
-            event = event_queue.get(timeout=1.0)
-            print(json.dumps(event.to_dict()))
-        except Empty:
-            continue
-```
-
-Usage:
-```bash
-python -m cascade.listen
-```
-        """,
-        exports=["event_queue", "Monitor"],
-        imports_from=["core.event"],
+        exports=("event_queue", "Monitor",),
+        imports_from=("core.event", "Monitor",),
     ),
     
     # ═══════════════════════════════════════════════════════════
@@ -1103,168 +464,500 @@ python -m cascade.listen
     "monitor": ModuleNode(
         name="Monitor",
         full_path="cascade_lattice.Monitor",
-        icon="📡",
-        category="core",
+        category=Category.CORE,
         parent="cascade_lattice",
-        doc_dummy="""
-# 📡 Monitor
-
-**What is this?** Your eyes and ears inside the system.
-
-It watches everything happening and can:
-- 📝 Record observations
-- 🔍 Trace cause and effect
-- 🔮 Predict what might happen next
-- 🕵️ Find root causes of problems
-
-**Like:** A flight recorder (black box) for AI systems.
-        """,
-        doc_scientist="""
-# Monitor (`cascade_lattice.Monitor`)
-
-Unified observation and causation tracking facade.
-
-```python
-class Monitor:
-    def __init__(self, component: str): 
-        self.component = component
-        self._graph = CausationGraph()
-        self._adapter = SymbioticAdapter()
-    
-    def observe(self, signal: Any) -> Event:
-        '''Interpret signal and add to causation graph'''
-        event = self._adapter.interpret(signal)
-        self._graph.add_event(event)
-        return event
-    
-    def analyze_impact(self, event_id: str, max_depth: int = 20) -> ImpactReport:
-        '''Forward trace: what did this event cause?'''
-    
-    def trace_backwards(self, event_id: str, max_depth: int = 10) -> List[CausationChain]:
-        '''Backward trace: what caused this event?'''
-    
-    def trace_forwards(self, event_id: str, max_depth: int = 10) -> List[CausationChain]:
-        '''Forward trace: what effects followed?'''
-    
-    def predict_cascade(self, event: Event) -> List[Event]:
-        '''Predict likely downstream effects'''
-    
-    def find_root_causes(self, event_id: str) -> List[Event]:
-        '''Find events with no causes in the subgraph'''
-```
-        """,
-        exports=["Monitor"],
-        imports_from=["core.graph", "core.adapter", "core.event"],
-        imported_by=["hold.session", "store"],
+        exports=("Monitor",),
+        imports_from=("core.graph", "core.adapter", "core.event",),
     ),
 }
 
+def _resolve_import_keys(graph: dict[str, ModuleNode]) -> dict[str, ModuleNode]:
+    """Rewrite every imports_from entry to the importee's graph key.
+
+    The authored edges name their targets by dotted path under the
+    package root ("core.event"), while top-level modules are keyed by
+    bare name ("event"). Resolving through the full_path suffixes here
+    means the reverse indices, edge table and closure below all see the
+    same edges the author wrote, instead of silently dropping any whose
+    spelling doesn't happen to match a key.
+    """
+    by_path = {
+        node.full_path[len("cascade_lattice."):]: key
+        for key, node in graph.items()
+        if node.full_path != "cascade_lattice"
+    }
+    return {
+        key: node._replace(
+            imports_from=tuple(by_path.get(dep, dep) for dep in node.imports_from)
+        )
+        for key, node in graph.items()
+    }
+
+
+def _intern_symbols(graph: dict[str, ModuleNode]) -> dict[str, ModuleNode]:
+    """Intern every symbol string in the graph.
+
+    Dotted names like "core.provenance" repeat across keys and edge
+    tuples but aren't auto-interned by CPython; interning collapses the
+    duplicates and makes dict lookups pointer comparisons.
+    """
+    return {
+        sys.intern(key): node._replace(
+            name=sys.intern(node.name),
+            full_path=sys.intern(node.full_path),
+            exports=tuple(map(sys.intern, node.exports)),
+            imports_from=tuple(map(sys.intern, node.imports_from)),
+            parent=sys.intern(node.parent) if node.parent else None,
+        )
+        for key, node in graph.items()
+    }
+
+
+# Read-only view: the graph is shared global state and must never be
+# mutated after import.
+MODULE_GRAPH: Mapping[str, ModuleNode] = MappingProxyType(
+    _intern_symbols(_resolve_import_keys(_MODULE_GRAPH))
+)
+
+
+def _build_reverse_indices() -> tuple[Mapping[str, tuple[str, ...]], Mapping[str, tuple[str, ...]]]:
+    """Derive backward edges from the forward edges in one pass.
+
+    Only `parent` and `imports_from` are authored by hand; children and
+    imported-by lists are computed here so the two directions can never
+    drift out of sync. Importing a submodule executes its enclosing
+    packages too, so each import also credits the target's ancestor
+    packages (stopping below the root, and never crediting a package
+    from inside itself) - that keeps package-level nodes like `core`
+    listing their importers the way the hand-written lists did.
+    """
+
+    def ancestors(key: str) -> set[str]:
+        out: set[str] = set()
+        parent = MODULE_GRAPH[key].parent
+        while parent is not None:
+            out.add(parent)
+            parent = MODULE_GRAPH[parent].parent
+        return out
+
+    root = next(k for k, n in MODULE_GRAPH.items() if n.parent is None)
+    children: dict[str, list[str]] = {}
+    imported_by: dict[str, list[str]] = {}
+    for key, node in MODULE_GRAPH.items():
+        if node.parent is not None:
+            children.setdefault(node.parent, []).append(key)
+        own_packages = ancestors(key) | {key}
+        for dep in node.imports_from:
+            target: str | None = dep
+            while target is not None and target in MODULE_GRAPH and target != root:
+                if target not in own_packages:
+                    users = imported_by.setdefault(target, [])
+                    if key not in users:
+                        users.append(key)
+                target = MODULE_GRAPH[target].parent
+    return (
+        MappingProxyType({k: tuple(v) for k, v in children.items()}),
+        MappingProxyType({k: tuple(v) for k, v in imported_by.items()}),
+    )
+
+
+CHILDREN_INDEX, IMPORTED_BY_INDEX = _build_reverse_indices()
+
+# Membership-side of the AoS->SoA split: node.imports_from keeps display
+# order, these frozensets answer "does X import Y?" in O(1).
+IMPORTS_FROM_SET: Mapping[str, frozenset] = MappingProxyType(
+    {key: frozenset(node.imports_from) for key, node in MODULE_GRAPH.items()}
+)
+
+
+def imports_directly(src: str, dst: str) -> bool:
+    """O(1) check whether module `src` imports `dst`."""
+    deps = IMPORTS_FROM_SET.get(src)
+    return deps is not None and dst in deps
+
+
+# ═══════════════════════════════════════════════════════════════
+# FLAT EDGE TABLE - SoA layout for graph-view rendering
+# ═══════════════════════════════════════════════════════════════
+
+# Edge kinds, in the order the connections panel displays them.
+EDGE_PARENT, EDGE_CHILD, EDGE_IMPORTS, EDGE_IMPORTED_BY = range(4)
+
+NAME_TO_ID: Mapping[str, int] = MappingProxyType(
+    {key: i for i, key in enumerate(MODULE_GRAPH)}
+)
+ID_TO_NAME: tuple[str, ...] = tuple(MODULE_GRAPH)
+
+# Dense node array aligned with the int ids: code holding an id from the
+# edge table indexes NODES directly - one array deref, no string hash.
+NODES: tuple[ModuleNode, ...] = tuple(MODULE_GRAPH.values())
+
+
+def _build_edge_table() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flatten all graph edges into three parallel int16 columns.
+
+    Rendering a node's connections becomes one contiguous scan over
+    `EDGES_SRC` instead of a nested Python loop over per-node tuples.
+    Edges pointing outside the graph (e.g. "brain") are dropped here,
+    matching the `.get(...) is None` skips the panel used to do.
+    """
+    src: list[int] = []
+    dst: list[int] = []
+    kind: list[int] = []
+
+    def emit(s: str, d: str, k: int) -> None:
+        if d in NAME_TO_ID:
+            src.append(NAME_TO_ID[s])
+            dst.append(NAME_TO_ID[d])
+            kind.append(k)
+
+    for key, node in MODULE_GRAPH.items():
+        if node.parent is not None:
+            emit(key, node.parent, EDGE_PARENT)
+        for child in CHILDREN_INDEX.get(key, ()):
+            emit(key, child, EDGE_CHILD)
+        for dep in node.imports_from:
+            emit(key, dep, EDGE_IMPORTS)
+        for user in IMPORTED_BY_INDEX.get(key, ()):
+            emit(key, user, EDGE_IMPORTED_BY)
+
+    return (
+        np.asarray(src, dtype=np.int16),
+        np.asarray(dst, dtype=np.int16),
+        np.asarray(kind, dtype=np.int16),
+    )
+
+
+EDGES_SRC, EDGES_DST, EDGES_KIND = _build_edge_table()
+
+
+def _compute_transitive_imports() -> Mapping[str, frozenset[str]]:
+    """Transitive closure of imports_from, folded once at import.
+
+    The import graph is static and acyclic, so each module's full
+    dependency set is computed bottom-up and shared: a query is then a
+    frozenset membership test instead of a fresh graph walk.
+    """
+    closure: dict[str, frozenset[str]] = {}
+
+    def visit(key: str) -> frozenset[str]:
+        cached = closure.get(key)
+        if cached is not None:
+            return cached
+        deps: set[str] = set()
+        for dep in IMPORTS_FROM_SET.get(key, frozenset()):
+            if dep in MODULE_GRAPH:
+                deps.add(dep)
+                deps |= visit(dep)
+        result = frozenset(deps)
+        closure[key] = result
+        return result
+
+    for key in MODULE_GRAPH:
+        visit(key)
+    return MappingProxyType(closure)
+
+
+TRANSITIVE_IMPORTS: Mapping[str, frozenset[str]] = _compute_transitive_imports()
+
+
+def imports_transitively(src: str, dst: str) -> bool:
+    """True if `src` depends on `dst` through any chain of imports."""
+    return dst in TRANSITIVE_IMPORTS.get(src, frozenset())
+
+
+def _build_related_lists() -> tuple[tuple[tuple[str, str, str], ...], ...]:
+    """Pre-render the CONNECTIONS list for every module.
+
+    The edge table never changes after import, so the (label, variant,
+    target key) triples each module displays - including the dedup and
+    per-kind display caps - can be fixed up front. The result is a
+    dense tuple aligned with NODES/ID_TO_NAME: one string hash to get
+    the node id, then plain integer indexing.
+    """
+    # (arrow, variant, display cap) per edge kind
+    kind_style = {
+        EDGE_PARENT: ("⬆️", "default", None),
+        EDGE_CHILD: ("⬇️", "primary", None),
+        EDGE_IMPORTS: ("📥", "success", 3),
+        EDGE_IMPORTED_BY: ("📤", "warning", 3),
+    }
+
+    related: list[tuple[tuple[str, str, str], ...]] = []
+    for key, node_id in NAME_TO_ID.items():
+        entries: list[tuple[str, str, str]] = []
+        added_keys: set[str] = set()
+        shown = {EDGE_IMPORTS: 0, EDGE_IMPORTED_BY: 0}
+
+        # Rows are already in display order (parent, children, imports,
+        # imported-by).
+        for row in np.nonzero(EDGES_SRC == node_id)[0]:
+            kind = int(EDGES_KIND[row])
+            target_id = int(EDGES_DST[row])
+            arrow, variant, cap = kind_style[kind]
+
+            if cap is not None:
+                if shown[kind] >= cap:
+                    continue
+                shown[kind] += 1
+
+            target_key = ID_TO_NAME[target_id]
+            if target_key in added_keys:
+                continue
+
+            target = NODES[target_id]
+            entries.append((f"{arrow} {target.icon} {target.name}", variant, target_key))
+            added_keys.add(target_key)
+        related.append(tuple(entries))
+    return tuple(related)
+
+
+_RELATED: tuple[tuple[tuple[str, str, str], ...], ...] = _build_related_lists()
+
+
+@lru_cache(maxsize=512)
+def find_path(src: str, dst: str) -> tuple[str, ...]:
+    """Shortest path between two modules over the import graph.
+
+    Treats import edges as undirected ("how are these two connected?").
+    Safe to memoize forever: MODULE_GRAPH is frozen, so results never
+    go stale. Returns () when the nodes aren't connected.
+    """
+    if src not in MODULE_GRAPH or dst not in MODULE_GRAPH:
+        return ()
+    if src == dst:
+        return (src,)
+
+    # BFS with parent backtracking
+    came_from: dict[str, str] = {src: src}
+    frontier = [src]
+    while frontier:
+        next_frontier: list[str] = []
+        for key in frontier:
+            neighbors = MODULE_GRAPH[key].imports_from + IMPORTED_BY_INDEX.get(key, ())
+            for n in neighbors:
+                if n not in MODULE_GRAPH or n in came_from:
+                    continue
+                came_from[n] = key
+                if n == dst:
+                    path = [n]
+                    while path[-1] != src:
+                        path.append(came_from[path[-1]])
+                    return tuple(reversed(path))
+                next_frontier.append(n)
+        frontier = next_frontier
+    return ()
+
 
 # ═══════════════════════════════════════════════════════════════
 # NAVIGATION STATE
 # ═══════════════════════════════════════════════════════════════
 
-@dataclass
 class NavState:
     """Navigation breadcrumb trail."""
-    path: List[str] = field(default_factory=lambda: ["cascade_lattice"])
-    
+
+    # Explicit __slots__ rather than @dataclass(slots=True): the latter
+    # needs Python 3.10 and this package still supports 3.9.
+    __slots__ = ("path", "_idx")
+
+    def __init__(self) -> None:
+        self.path: list[str] = ["cascade_lattice"]
+        # module -> position in path; doubles as the membership set so
+        # jump_to is two dict hits instead of two linear list scans
+        self._idx: dict[str, int] = {"cascade_lattice": 0}
+
     @property
     def current(self) -> str:
         return self.path[-1] if self.path else "cascade_lattice"
-    
+
     def push(self, module: str) -> None:
-        if module not in self.path:
+        if module not in self._idx:
+            self._idx[module] = len(self.path)
             self.path.append(module)
-    
-    def pop(self) -> Optional[str]:
+
+    def pop(self) -> str | None:
         if len(self.path) > 1:
-            return self.path.pop()
+            module = self.path.pop()
+            del self._idx[module]
+            return module
         return None
-    
+
     def jump_to(self, module: str) -> None:
         """Jump directly to a module (creative routing)."""
-        if module in self.path:
+        idx = self._idx.get(module)
+        if idx is not None:
             # Already visited - trim path to that point
-            idx = self.path.index(module)
+            for dropped in self.path[idx + 1:]:
+                del self._idx[dropped]
             self.path = self.path[:idx + 1]
         else:
             # New destination - add to path
+            self._idx[module] = len(self.path)
             self.path.append(module)
-    
+
     def reset(self) -> None:
         self.path = ["cascade_lattice"]
+        self._idx = {"cascade_lattice": 0}
 
 
 # Global nav state
 _nav = NavState()
 
 
+# ═══════════════════════════════════════════════════════════════
+# LAZY BACKEND MODULES
+# ═══════════════════════════════════════════════════════════════
+
+# store/genesis drag in the whole persistence stack; import them once,
+# on first use (or from the warm-up worker), and hand out the cached
+# module afterwards so screen callbacks never pay import machinery.
+
+_store = None
+_genesis = None
+
+
+def _get_store():
+    """cascade_lattice.store, imported on first call."""
+    global _store
+    if _store is None:
+        from cascade_lattice import store
+        _store = store
+    return _store
+
+
+def _get_genesis():
+    """cascade_lattice.genesis, imported on first call."""
+    global _genesis
+    if _genesis is None:
+        from cascade_lattice import genesis
+        _genesis = genesis
+    return _genesis
+
+
+# Submodules the screens and demos touch on first interaction. Warmed
+# in the same background worker so the serial import chain overlaps
+# with Textual's DOM construction instead of running on first keypress.
+_WARM_MODULES = (
+    "cascade.store",
+    "cascade.genesis",
+    "cascade.hold",
+    "cascade.core.provenance",
+    "cascade.sdk",
+)
+
+
+def _warm_backends() -> None:
+    """Resolve the heavy imports ahead of the first screen that needs them."""
+    import importlib
+    for name in _WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # Screens surface their own errors on use
+    try:
+        _get_store()
+        _get_genesis()
+    except Exception:
+        pass
+
+
 # ═══════════════════════════════════════════════════════════════
 # CUSTOM WIDGETS
 # ═══════════════════════════════════════════════════════════════
 
+# Rendered Text per navigation state. The graph is immutable, so a
+# given breadcrumb path / module key always renders the same spans -
+# memoize them instead of rebuilding Text on every repaint. Cached
+# Text objects are treated as immutable by all callers.
+
+@lru_cache(maxsize=64)
+def _render_breadcrumb(path: tuple[str, ...]) -> Text:
+    text = Text()
+    text.append("📍 ", style="bold")
+
+    for i, module in enumerate(path):
+        node = MODULE_GRAPH.get(module)
+        icon = node.icon if node else "📦"
+
+        if i > 0:
+            text.append(" → ", style="dim")
+
+        if i == len(path) - 1:
+            # Current module (highlighted)
+            text.append(f"{icon} {module}", style="bold cyan")
+        else:
+            # Previous modules (clickable look)
+            text.append(f"{icon} {module}", style="blue underline")
+
+    return text
+
+
+@lru_cache(maxsize=128)
+def _render_exports(module_key: str) -> Text:
+    node = MODULE_GRAPH.get(module_key)
+    if not node or not node.exports:
+        return Text("No exports")
+
+    text = Text()
+    text.append("📦 EXPORTS\n\n", style="bold green")
+
+    for exp in node.exports:
+        # Guess type from name
+        if exp[0].isupper():
+            text.append("  ● ", style="cyan")
+            text.append(f"{exp}\n", style="bold cyan")
+        else:
+            text.append("  ○ ", style="yellow")
+            text.append(f"{exp}()\n", style="yellow")
+
+    return text
+
+
 class BreadcrumbWidget(Static):
     """Navigation breadcrumb trail."""
-    
+
     path = reactive(["cascade_lattice"])
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._text = _render_breadcrumb(("cascade_lattice",))
+
+    def watch_path(self, path: list[str]) -> None:
+        # Resolve spans when the path changes, not on every paint.
+        # Reactive holds a list; tuple-ize for a hashable cache key.
+        self._text = _render_breadcrumb(tuple(path))
+
     def render(self) -> Text:
-        text = Text()
-        text.append("📍 ", style="bold")
-        
-        for i, module in enumerate(self.path):
-            node = MODULE_GRAPH.get(module)
-            icon = node.icon if node else "📦"
-            
-            if i > 0:
-                text.append(" → ", style="dim")
-            
-            if i == len(self.path) - 1:
-                # Current module (highlighted)
-                text.append(f"{icon} {module}", style="bold cyan")
-            else:
-                # Previous modules (clickable look)
-                text.append(f"{icon} {module}", style="blue underline")
-        
-        return text
+        return self._text
+
+
+@lru_cache(maxsize=128)
+def _render_card(module_key: str) -> Text:
+    node = MODULE_GRAPH.get(module_key, ModuleNode(name=module_key, full_path=module_key))
+    text = Text()
+    text.append(f"{node.icon} ", style="bold")
+    text.append(f"{node.name}\n", style="bold cyan")
+
+    # Category badge
+    text.append(f"[{node.category.label}]", style=_CAT_STYLE.get(node.category, "bold white"))
+
+    # Export count
+    if node.exports:
+        text.append(f" • {len(node.exports)} exports", style="dim")
+
+    return text
 
 
 class ModuleCard(Static):
     """A clickable module card."""
-    
+
     def __init__(self, module_key: str, **kwargs):
         super().__init__(**kwargs)
         self.module_key = module_key
         self.node = MODULE_GRAPH.get(module_key, ModuleNode(name=module_key, full_path=module_key))
-    
+
     def compose(self) -> ComposeResult:
-        yield Static(self._render_card(), id=f"card-content-{self.module_key}")
-    
-    def _render_card(self) -> Text:
-        text = Text()
-        text.append(f"{self.node.icon} ", style="bold")
-        text.append(f"{self.node.name}\n", style="bold cyan")
-        
-        # Category badge
-        cat_colors = {
-            "root": "magenta",
-            "core": "blue", 
-            "hold": "yellow",
-            "store": "green",
-            "genesis": "red",
-            "viz": "cyan",
-            "diagnostics": "orange1",
-            "forensics": "purple",
-        }
-        color = cat_colors.get(self.node.category, "white")
-        text.append(f"[{self.node.category}]", style=f"bold {color}")
-        
-        # Export count
-        if self.node.exports:
-            text.append(f" • {len(self.node.exports)} exports", style="dim")
-        
-        return text
+        yield Static(_render_card(self.module_key), id=f"card-content-{self.module_key}")
 
 
 class RelatedModulesPanel(Vertical):
@@ -1278,120 +971,166 @@ class RelatedModulesPanel(Vertical):
             self.module_key = module_key
             super().__init__()
     
+    # Pool size; no module in the graph shows more related entries
+    MAX_RELATED = 12
+
     def compose(self) -> ComposeResult:
         yield Label("🔗 CONNECTIONS", classes="panel-title")
-        yield Vertical(id="related-buttons")
-    
+        # Fixed pool of buttons mounted once; navigation only retitles
+        # and shows/hides them, avoiding widget mount/unmount churn
+        # (CSS node allocation, style compile, layout) on every click.
+        with Vertical(id="related-buttons"):
+            for _ in range(self.MAX_RELATED):
+                btn = Button("", classes="related-btn")
+                btn.display = False
+                yield btn
+
     def watch_module_key(self, module_key: str) -> None:
         """Rebuild buttons when module changes."""
         self._rebuild_buttons()
-    
+
     def on_mount(self) -> None:
+        self._pool: list[Button] = list(self.query(Button))
+        self._btn_to_key: dict[Button, str] = {}
         self._rebuild_buttons()
-    
+
     def _rebuild_buttons(self) -> None:
-        """Rebuild the related module buttons."""
-        try:
-            container = self.query_one("#related-buttons", Vertical)
-            container.remove_children()
-        except NoMatches:
-            return
-        
-        node = MODULE_GRAPH.get(self.module_key)
-        if not node:
-            return
-        
-        added_keys = set()  # Track what we've added to avoid duplicates
-        
-        # Parent button
-        if node.parent and node.parent not in added_keys:
-            parent = MODULE_GRAPH.get(node.parent)
-            if parent:
-                btn = Button(f"⬆️ {parent.icon} {parent.name}", variant="default", classes="related-btn")
-                btn.tooltip = node.parent  # Store module key in tooltip
-                container.mount(btn)
-                added_keys.add(node.parent)
-        
-        # Children buttons
-        for child_key in node.children:
-            if child_key not in added_keys:
-                child = MODULE_GRAPH.get(child_key)
-                if child:
-                    btn = Button(f"⬇️ {child.icon} {child.name}", variant="primary", classes="related-btn")
-                    btn.tooltip = child_key
-                    container.mount(btn)
-                    added_keys.add(child_key)
-        
-        # Imports from
-        for imp in node.imports_from[:3]:
-            if imp not in added_keys:
-                imp_node = MODULE_GRAPH.get(imp)
-                if imp_node:
-                    btn = Button(f"📥 {imp_node.icon} {imp_node.name}", variant="success", classes="related-btn")
-                    btn.tooltip = imp
-                    container.mount(btn)
-                    added_keys.add(imp)
-        
-        # Imported by
-        for imp in node.imported_by[:3]:
-            if imp not in added_keys:
-                imp_node = MODULE_GRAPH.get(imp)
-                if imp_node:
-                    btn = Button(f"📤 {imp_node.icon} {imp_node.name}", variant="warning", classes="related-btn")
-                    btn.tooltip = imp
-                    container.mount(btn)
-                    added_keys.add(imp)
-    
+        """Retarget the pooled buttons at the current module's relations."""
+        pool = getattr(self, "_pool", None)
+        if not pool:
+            return  # Not mounted yet
+
+        # Labels, variants and ordering were all fixed at import time
+        node_id = NAME_TO_ID.get(self.module_key)
+        entries = _RELATED[node_id] if node_id is not None else ()
+        for btn, (label, variant, target_key) in zip(pool, entries):
+            btn.label = label
+            btn.variant = variant
+            btn.tooltip = target_key
+            self._btn_to_key[btn] = target_key
+            btn.display = True
+        for btn in pool[len(entries):]:
+            btn.display = False
+            self._btn_to_key.pop(btn, None)
+
     @on(Button.Pressed)
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle related module button click."""
-        # Get module key from button tooltip
-        module_key = event.button.tooltip
+        module_key = self._btn_to_key.get(event.button)
         if module_key and module_key in MODULE_GRAPH:
             self.post_message(self.ModuleClicked(module_key))
 
 
+class LazyModuleTree(Tree):
+    """Module tree that materializes children on demand.
+
+    Children are added when a node is first expanded, so paint cost
+    tracks visible rows rather than total graph size. Collapsed
+    subtrees are kept in a bounded LRU; the oldest are pruned back to
+    placeholders once the budget is exceeded.
+    """
+
+    MAX_CACHED_SUBTREES = 128
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded: OrderedDict[str, TreeNode] = OrderedDict()
+        # module key -> materialized TreeNode, so selection resolves
+        # nodes by lookup instead of scanning children per level
+        self._node_index: dict[str, TreeNode] = {}
+
+    def lookup(self, key: str) -> TreeNode | None:
+        """Materialized TreeNode for a module key, if one exists."""
+        return self._node_index.get(key)
+
+    def populate(self, tree_node: TreeNode, key: str) -> None:
+        """Add one level of children under `tree_node` (idempotent)."""
+        if key in self._loaded:
+            self._loaded.move_to_end(key)
+            return
+        for child_key in CHILDREN_INDEX.get(key, ()):
+            child = MODULE_GRAPH.get(child_key)
+            if child:
+                self._node_index[child_key] = tree_node.add(
+                    f"{child.icon} {child.name}",
+                    data=child_key,
+                    allow_expand=bool(CHILDREN_INDEX.get(child_key)),
+                )
+        self._loaded[key] = tree_node
+        self._evict_stale()
+
+    def _evict_stale(self) -> None:
+        """Prune least-recently-used collapsed subtrees back to lazy."""
+        while len(self._loaded) > self.MAX_CACHED_SUBTREES:
+            for key, tree_node in self._loaded.items():
+                if not tree_node.is_expanded and tree_node is not self.root:
+                    for child in tree_node.children:
+                        self._node_index.pop(child.data, None)
+                    tree_node.remove_children()
+                    del self._loaded[key]
+                    break
+            else:
+                return  # Everything cached is expanded; nothing to prune
+
+    @on(Tree.NodeExpanded)
+    def _materialize_on_expand(self, event: Tree.NodeExpanded) -> None:
+        if event.node.data:
+            self.populate(event.node, event.node.data)
+
+    def clear(self):
+        self._loaded.clear()
+        self._node_index.clear()
+        return super().clear()
+
+
 class ExportsPanel(Static):
     """Shows exports of current module."""
     
     module_key = reactive("cascade_lattice")
-    
+
     def render(self) -> Text:
-        node = MODULE_GRAPH.get(self.module_key)
-        if not node or not node.exports:
-            return Text("No exports")
-        
-        text = Text()
-        text.append("📦 EXPORTS\n\n", style="bold green")
-        
-        for exp in node.exports:
-            # Guess type from name
-            if exp[0].isupper():
-                text.append("  ● ", style="cyan")
-                text.append(f"{exp}\n", style="bold cyan")
-            else:
-                text.append("  ○ ", style="yellow")
-                text.append(f"{exp}()\n", style="yellow")
-        
-        return text
+        return _render_exports(self.module_key)
 
 
 class LiveStatsWidget(Static):
     """Live statistics from cascade-lattice store."""
-    
+
+    class StatsReady(Message):
+        """Fresh stats snapshot from the polling worker."""
+        def __init__(self, stats: dict, digest: int) -> None:
+            self.stats = stats
+            self.digest = digest
+            super().__init__()
+
     def on_mount(self) -> None:
+        self._stats_digest = 0
         self.set_interval(5.0, self._refresh_stats)
         self._refresh_stats()
-    
+
     def _refresh_stats(self) -> None:
+        # stats() hits the store on disk; keep it off the event loop so
+        # a slow store never stalls the UI tick
+        self.run_worker(self._fetch_stats, thread=True, exclusive=True, group="live-stats")
+
+    def _fetch_stats(self) -> None:
         try:
-            from cascade_lattice.store import stats
-            s = stats()
-            self._stats = s
+            s = _get_store().stats()
         except Exception as e:
-            self._stats = {"error": str(e)}
+            s = {"error": str(e)}
+        try:
+            digest = hash(json.dumps(s, sort_keys=True, default=str))
+        except TypeError:
+            digest = id(s)
+        self.post_message(self.StatsReady(s, digest))
+
+    @on(StatsReady)
+    def _apply_stats(self, event: StatsReady) -> None:
+        if event.digest == self._stats_digest:
+            return  # Idle tick - nothing changed, skip the repaint
+        self._stats_digest = event.digest
+        self._stats = event.stats
         self.refresh()
-    
+
     def render(self) -> Text:
         text = Text()
         text.append("📊 LIVE STATS\n\n", style="bold magenta")
@@ -1417,9 +1156,10 @@ class LiveStatsWidget(Static):
         models = s.get('models', {})
         if models:
             text.append(f"\nTop Models:\n", style="dim")
-            sorted_models = sorted(models.items(), key=lambda x: x[1], reverse=True)[:5]
-            for name, count in sorted_models:
-                short_name = name[:25] + "..." if len(name) > 25 else name
+            # nlargest is O(N log 5) versus O(N log N) for a full sort -
+            # the gap grows as the store accumulates model ids
+            for name, count in nlargest(5, models.items(), key=itemgetter(1)):
+                short_name = name if len(name) <= 25 else name[:25] + "..."
                 text.append(f"  {short_name}: ", style="white")
                 text.append(f"{count:,}\n", style="cyan")
         
@@ -1437,14 +1177,31 @@ class ExplorerScreen(Screen):
         Binding("escape", "go_back", "Back"),
         Binding("h", "go_home", "Home"),
         Binding("t", "toggle_mode", "Toggle Explanation"),
-        Binding("s", "go_stats", "Stats"),
-        Binding("d", "go_demo", "Demo"),
+        Binding("c", "view_code", "View Code"),
+        Binding("s", "app.switch_mode('stats')", "Stats"),
+        Binding("d", "app.switch_mode('demo')", "Demo"),
     ]
     
     # Explanation mode
     scientist_mode = reactive(False)
     current_module = reactive("cascade_lattice")
-    
+
+    # Widget refs cached once in on_mount; query_one walks the DOM on
+    # every call, which adds up in navigation/key-handling hot paths.
+    _breadcrumb: BreadcrumbWidget | None = None
+    _doc_content: Static | None = None
+    _related_panel: RelatedModulesPanel | None = None
+    _exports_panel: ExportsPanel | None = None
+    _tree: LazyModuleTree | None = None
+    _mode_label: Label | None = None
+    _mode_toggle: Switch | None = None
+
+    # (module, mode) currently shown in the doc pane; None when the pane
+    # holds something else (e.g. source view) and must be repainted.
+    _shown_doc: tuple[str, str] | None = None
+    # (module, scientist_mode) last painted by _update_view
+    _last_rendered: tuple[str, bool] | None = None
+
     def compose(self) -> ComposeResult:
         yield Header()
         
@@ -1459,13 +1216,13 @@ class ExplorerScreen(Screen):
                 # Left: Module tree
                 with Vertical(id="left-panel"):
                     yield Label("🗂️ MODULES", classes="panel-title")
-                    yield Tree("cascade-lattice", id="module-tree")
+                    yield LazyModuleTree("cascade-lattice", id="module-tree")
                 
                 # Center: Documentation
                 with Vertical(id="center-panel"):
                     yield Label("📖 DOCUMENTATION", classes="panel-title")
                     with ScrollableContainer(id="doc-scroll"):
-                        yield Markdown("", id="doc-content")
+                        yield Static(id="doc-content")
                 
                 # Right: Related + Exports
                 with Vertical(id="right-panel"):
@@ -1476,68 +1233,71 @@ class ExplorerScreen(Screen):
         yield Footer()
     
     def on_mount(self) -> None:
+        self._breadcrumb = self.query_one("#breadcrumb", BreadcrumbWidget)
+        self._doc_content = self.query_one("#doc-content", Static)
+        self._related_panel = self.query_one("#related-panel", RelatedModulesPanel)
+        self._exports_panel = self.query_one("#exports-panel", ExportsPanel)
+        self._tree = self.query_one("#module-tree", LazyModuleTree)
+        self._mode_label = self.query_one("#mode-label", Label)
+        self._mode_toggle = self.query_one("#mode-toggle", Switch)
         self._build_tree()
         self._update_view()
-    
+
     def _build_tree(self) -> None:
-        """Build the module tree."""
-        tree = self.query_one("#module-tree", Tree)
-        tree.clear()
-        tree.root.expand()
-        tree.show_root = True
-        tree.guide_depth = 4
-        
-        def add_children(parent_node: TreeNode, parent_key: str):
-            node = MODULE_GRAPH.get(parent_key)
-            if not node:
-                return
-            
-            for child_key in node.children:
-                child = MODULE_GRAPH.get(child_key)
-                if child:
-                    child_node = parent_node.add(
-                        f"{child.icon} {child.name}",
-                        data=child_key
-                    )
-                    add_children(child_node, child_key)
-        
-        # Start with root
-        root = MODULE_GRAPH.get("cascade_lattice")
-        if root:
-            tree.root.set_label(f"{root.icon} cascade_lattice")
-            tree.root.data = "cascade_lattice"
-            add_children(tree.root, "cascade_lattice")
+        """Build the visible first level of the module tree.
+
+        Deeper levels are materialized lazily by LazyModuleTree when
+        their parent is expanded.
+        """
+        tree = self._tree
+        if tree is None:
+            return
+
+        # Suppress per-insertion refreshes: populate, then repaint once.
+        with self.app.batch_update():
+            tree.clear()
+            tree.show_root = True
+            tree.guide_depth = 4
+
+            root = MODULE_GRAPH.get("cascade_lattice")
+            if root:
+                tree.root.set_label(f"{root.icon} cascade_lattice")
+                tree.root.data = "cascade_lattice"
+                tree.root.expand()
     
     def _update_view(self) -> None:
-        """Update all panels for current module."""
+        """Update all panels for current module in one batched paint."""
         node = MODULE_GRAPH.get(self.current_module)
         if not node:
             return
-        
-        # Update breadcrumb
-        try:
-            self.query_one("#breadcrumb", BreadcrumbWidget).path = list(_nav.path)
-        except NoMatches:
-            pass
-        
-        # Update documentation
-        doc = node.doc_scientist if self.scientist_mode else node.doc_dummy
-        try:
-            self.query_one("#doc-content", Markdown).update(doc)
-        except NoMatches:
-            pass
-        
-        # Update related panel
-        try:
-            self.query_one("#related-panel", RelatedModulesPanel).module_key = self.current_module
-        except NoMatches:
-            pass
-        
-        # Update exports panel
-        try:
-            self.query_one("#exports-panel", ExportsPanel).module_key = self.current_module
-        except NoMatches:
-            pass
+
+        if self._doc_content is None:
+            return  # Not mounted yet
+
+        # Selecting the node we're already on (breadcrumb click, tree
+        # re-select) is a no-op - unless the doc pane was replaced by a
+        # source view and needs its doc back.
+        rendered = (self.current_module, self.scientist_mode)
+        if rendered == self._last_rendered and self._shown_doc is not None:
+            return
+        self._last_rendered = rendered
+
+        # Coalesce the four panel updates into a single reflow + paint
+        # instead of one refresh per reactive change.
+        with self.app.batch_update():
+            self._breadcrumb.path = list(_nav.path)
+
+            # Documentation (cached renderable - no re-parse on revisit).
+            # Skip the update entirely when the pane already shows this
+            # doc, e.g. focus bounces re-triggering the view refresh.
+            mode = "scientist" if self.scientist_mode else "dummy"
+            doc_key = (node.full_path, mode)
+            if doc_key != self._shown_doc:
+                self._doc_content.update(_doc_renderable(node.full_path, mode))
+                self._shown_doc = doc_key
+
+            self._related_panel.module_key = self.current_module
+            self._exports_panel.module_key = self.current_module
     
     @on(Tree.NodeSelected)
     def on_tree_select(self, event: Tree.NodeSelected) -> None:
@@ -1563,36 +1323,81 @@ class ExplorerScreen(Screen):
         self._select_in_tree(event.module_key)
     
     def _select_in_tree(self, module_key: str) -> None:
-        """Find and select a module in the tree."""
-        try:
-            tree = self.query_one("#module-tree", Tree)
-            def find_node(node: TreeNode, key: str) -> Optional[TreeNode]:
-                if node.data == key:
-                    return node
-                for child in node.children:
-                    found = find_node(child, key)
-                    if found:
-                        return found
-                return None
-            
-            target = find_node(tree.root, module_key)
-            if target:
-                target.expand()
-                tree.select_node(target)
-        except NoMatches:
-            pass
+        """Find and select a module in the tree.
+
+        Walks down from the root along the parent chain, expanding each
+        ancestor so the lazy tree materializes the path to the target.
+        """
+        tree = self._tree
+        if tree is None:
+            return
+
+        # Ancestor chain: root ... parent, target
+        chain = [module_key]
+        while (parent := MODULE_GRAPH[chain[-1]].parent) is not None:
+            chain.append(parent)
+        chain.reverse()
+        if chain[0] != "cascade_lattice":
+            return  # Detached node; nothing to select
+
+        current = tree.root
+        for key in chain[1:]:
+            current.expand()
+            tree.populate(current, current.data)
+            nxt = tree.lookup(key)
+            if nxt is None:
+                return
+            current = nxt
+        current.expand()
+        # Freshly materialized nodes have no line numbers until the tree
+        # rebuilds; force that so the cursor lands on the right row.
+        _ = tree._tree_lines
+        tree.select_node(current)
     
     def watch_scientist_mode(self, value: bool) -> None:
         """React to mode change."""
-        try:
-            label = self.query_one("#mode-label", Label)
-            if value:
-                label.update("🧪 Scientist Mode")
-            else:
-                label.update("📚 For Dummies")
-        except NoMatches:
-            pass
+        if self._mode_label is None:
+            return
+        if value:
+            self._mode_label.update("🧪 Scientist Mode")
+        else:
+            self._mode_label.update("📚 For Dummies")
     
+    class SourceLoaded(Message):
+        """Posted by the source-loading worker when highlighting is done."""
+        def __init__(self, module_key: str, syntax: Syntax) -> None:
+            self.module_key = module_key
+            self.syntax = syntax
+            super().__init__()
+
+    def action_view_code(self) -> None:
+        """Show the current module's source in the doc pane."""
+        node = MODULE_GRAPH.get(self.current_module)
+        if not node:
+            return
+        # The graph names modules under the cascade_lattice alias; the
+        # real source lives in the cascade package.
+        source_path = node.full_path.replace("cascade_lattice", "cascade", 1)
+        self._load_source(self.current_module, source_path)
+
+    @work(exclusive=True, thread=True)
+    def _load_source(self, module_key: str, source_path: str) -> None:
+        """Read + highlight source off the UI thread, then post back.
+
+        First view of a module pays disk I/O and Pygments lexing; doing
+        it in a worker keeps the paint loop responsive. Repeat views hit
+        the lru_cache and return immediately.
+        """
+        self.post_message(self.SourceLoaded(module_key, _module_syntax(source_path)))
+
+    @on(SourceLoaded)
+    def _on_source_loaded(self, event: SourceLoaded) -> None:
+        if event.module_key != self.current_module:
+            return  # User navigated away while the worker ran
+        if self._doc_content is not None:
+            self._doc_content.update(event.syntax)
+            self._shown_doc = None  # Pane no longer holds a doc
+
     def action_go_back(self) -> None:
         """Go back in navigation."""
         popped = _nav.pop()
@@ -1608,16 +1413,8 @@ class ExplorerScreen(Screen):
     
     def action_toggle_mode(self) -> None:
         """Toggle explanation mode."""
-        toggle = self.query_one("#mode-toggle", Switch)
-        toggle.value = not toggle.value
-    
-    def action_go_stats(self) -> None:
-        """Switch to stats screen."""
-        self.app.switch_mode("stats")
-    
-    def action_go_demo(self) -> None:
-        """Switch to demo screen."""
-        self.app.switch_mode("demo")
+        if self._mode_toggle is not None:
+            self._mode_toggle.value = not self._mode_toggle.value
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -1628,7 +1425,7 @@ class StatsScreen(Screen):
     """Live statistics dashboard."""
     
     BINDINGS = [
-        Binding("escape", "go_explorer", "Explorer"),
+        Binding("escape", "app.switch_mode('explorer')", "Explorer"),
         Binding("r", "refresh", "Refresh"),
     ]
     
@@ -1652,35 +1449,44 @@ class StatsScreen(Screen):
         yield Footer()
     
     def on_mount(self) -> None:
+        self._genesis_info = self.query_one("#genesis-info", Static)
+        self._store_info = self.query_one("#store-info", Static)
         self._load_genesis_info()
         self._load_store_info()
-    
+
+    # Both loaders touch the backend (genesis root computation, store
+    # directory stat); run them off the event loop so switching to this
+    # screen never freezes the UI, and marshal the final update back.
+
     def _load_genesis_info(self) -> None:
+        self.run_worker(self._fetch_genesis_info, thread=True, exclusive=True, group="genesis-info")
+
+    def _fetch_genesis_info(self) -> None:
         try:
-            import cascade_lattice as cl
+            gen = _get_genesis()
             text = Text()
             text.append("Genesis Root: ", style="dim")
-            text.append(f"{cl.genesis.get_genesis_root()}\n\n", style="bold yellow")
+            text.append(f"{gen.get_genesis_root()}\n\n", style="bold yellow")
             text.append("Genesis Message:\n", style="dim")
-            text.append(f'"{cl.genesis.GENESIS_INPUT}"', style="italic cyan")
-            self.query_one("#genesis-info", Static).update(text)
+            text.append(f'"{gen.GENESIS_INPUT}"', style="italic cyan")
         except Exception as e:
-            self.query_one("#genesis-info", Static).update(f"Error: {e}")
-    
+            text = f"Error: {e}"
+        self.app.call_from_thread(self._genesis_info.update, text)
+
     def _load_store_info(self) -> None:
+        self.run_worker(self._fetch_store_info, thread=True, exclusive=True, group="store-info")
+
+    def _fetch_store_info(self) -> None:
         try:
-            from cascade_lattice.store import DEFAULT_LATTICE_DIR, CENTRAL_DATASET
+            store = _get_store()
             text = Text()
             text.append("Local Store: ", style="dim")
-            text.append(f"{DEFAULT_LATTICE_DIR}\n\n", style="cyan")
+            text.append(f"{store.DEFAULT_LATTICE_DIR}\n\n", style="cyan")
             text.append("Central Dataset: ", style="dim")
-            text.append(f"{CENTRAL_DATASET}\n", style="green")
-            self.query_one("#store-info", Static).update(text)
+            text.append(f"{store.CENTRAL_DATASET}\n", style="green")
         except Exception as e:
-            self.query_one("#store-info", Static).update(f"Error: {e}")
-    
-    def action_go_explorer(self) -> None:
-        self.app.switch_mode("explorer")
+            text = f"Error: {e}"
+        self.app.call_from_thread(self._store_info.update, text)
     
     def action_refresh(self) -> None:
         self._load_genesis_info()
@@ -1692,11 +1498,86 @@ class StatsScreen(Screen):
 # DEMO SCREEN
 # ═══════════════════════════════════════════════════════════════
 
+# The four demo snippets never change; highlight them once at import
+# so a demo click is a plain dict lookup instead of a fresh Syntax
+# build (compile-the-regex-once, applied to pygments).
+_DEMO_CODE: dict[str, str] = {
+    "hold": '''from cascade_lattice import Hold, HoldPoint, HoldState
+import numpy as np
+
+# Create a HoldPoint (freeze-frame snapshot)
+hp = HoldPoint(
+    action_probs=np.array([0.1, 0.3, 0.6]),
+    value=0.75,
+    observation={"screen": "game_frame_42"},
+    brain_id="demo_agent"
+)
+
+print(f"HoldPoint ID: {hp.id}")
+print(f"Merkle Root: {hp.merkle_root}")
+print(f"State: {hp.state}")
+print(f"Action Labels: Jump, Duck, Run")''',
+
+    "observe": '''from cascade_lattice.store import observe, query, stats
+
+# Create an observation
+receipt = observe(
+    model_id="demo_model",
+    data={"action": "explore", "reward": 1.0},
+    sync=False  # Don't sync to HuggingFace
+)
+
+print(f"CID: {receipt.cid}")
+print(f"Merkle: {receipt.merkle_root}")
+
+# Query recent observations
+recent = query("demo_model", limit=5)
+print(f"Found {len(recent)} observations")''',
+
+    "genesis": '''import cascade_lattice as cl
+
+# Get the genesis root
+root = cl.genesis.get_genesis_root()
+print(f"Genesis Root: {root}")
+
+# The genesis message
+print(f"Message: {cl.genesis.GENESIS_INPUT}")
+
+# Create a provenance chain
+chain = cl.genesis.create_genesis()
+print(f"Chain verified: {chain.verify()}")''',
+
+    "provenance": '''from cascade_lattice.core.provenance import (
+    hash_tensor, hash_input, compute_merkle_root
+)
+import numpy as np
+
+# Hash a tensor
+tensor = np.random.randn(100).astype(np.float32)
+t_hash = hash_tensor(tensor)
+
+# Hash an input
+input_data = {"query": "What is 2+2?", "context": []}
+i_hash = hash_input(input_data)
+
+# Compute merkle root
+root = compute_merkle_root([t_hash, i_hash])
+print(f"Merkle Root: {root}")''',
+}
+
+_DEMO_SYNTAX: dict[str, Syntax] = {name: _make_syntax(src) for name, src in _DEMO_CODE.items()}
+
+# Demo tensor source: PCG64 generator writing float32 directly into a
+# reusable buffer - no float64 temporary, no per-click allocation.
+_RNG = np.random.default_rng()
+_DEMO_TENSOR = np.empty(100, dtype=np.float32)
+
+
 class DemoScreen(Screen):
     """Interactive demo playground."""
     
     BINDINGS = [
-        Binding("escape", "go_explorer", "Explorer"),
+        Binding("escape", "app.switch_mode('explorer')", "Explorer"),
         Binding("1", "demo_hold", "HOLD Demo"),
         Binding("2", "demo_observe", "Observe Demo"),
         Binding("3", "demo_genesis", "Genesis Demo"),
@@ -1741,38 +1622,25 @@ class DemoScreen(Screen):
     def on_provenance_demo(self) -> None:
         self._run_provenance_demo()
     
-    def _show_code(self, code: str) -> None:
-        syntax = Syntax(code, "python", theme="monokai", line_numbers=True)
-        self.query_one("#code-display", Static).update(syntax)
-    
-    def _log(self, message: str, style: str = "white") -> None:
-        log = self.query_one("#output-log", RichLog)
-        log.write(Text(message, style=style))
-    
-    def _run_hold_demo(self) -> None:
-        code = '''from cascade_lattice import Hold, HoldPoint, HoldState
-import numpy as np
+    def on_mount(self) -> None:
+        self._code_display = self.query_one("#code-display", Static)
+        self._output_log = self.query_one("#output-log", RichLog)
 
-# Create a HoldPoint (freeze-frame snapshot)
-hp = HoldPoint(
-    action_probs=np.array([0.1, 0.3, 0.6]),
-    value=0.75,
-    observation={"screen": "game_frame_42"},
-    brain_id="demo_agent"
-)
+    def _show_code(self, name: str) -> None:
+        self._code_display.update(_DEMO_SYNTAX[name])
+
+    def _log(self, lines: list[tuple[str, str]]) -> None:
+        # One write = one RichLog refresh, however many lines a demo emits.
+        self._output_log.write(Group(*(Text(m, style=s) for m, s in lines)))
+
+    def _run_hold_demo(self) -> None:
+        self._show_code("hold")
+        lines = [("═══ HOLD DEMO ═══", "bold magenta")]
 
-print(f"HoldPoint ID: {hp.id}")
-print(f"Merkle Root: {hp.merkle_root}")
-print(f"State: {hp.state}")
-print(f"Action Labels: Jump, Duck, Run")'''
-        
-        self._show_code(code)
-        self._log("═══ HOLD DEMO ═══", "bold magenta")
-        
         try:
             from cascade_lattice import Hold, HoldPoint, HoldState
             import numpy as np
-            
+
             hp = HoldPoint(
                 action_probs=np.array([0.1, 0.3, 0.6]),
                 value=0.75,
@@ -1780,126 +1648,89 @@ print(f"Action Labels: Jump, Duck, Run")'''
                 brain_id="demo_agent",
                 action_labels=["Jump", "Duck", "Run"]
             )
-            
-            self._log(f"✓ Created HoldPoint", "green")
-            self._log(f"  ID: {hp.id}", "cyan")
-            self._log(f"  Merkle: {hp.merkle_root}", "yellow")
-            self._log(f"  State: {hp.state.value}", "white")
-            self._log(f"  Best Action: Run (60%)", "bold cyan")
-        except Exception as e:
-            self._log(f"✗ Error: {e}", "red")
-    
-    def _run_observe_demo(self) -> None:
-        code = '''from cascade_lattice.store import observe, query, stats
 
-# Create an observation
-receipt = observe(
-    model_id="demo_model",
-    data={"action": "explore", "reward": 1.0},
-    sync=False  # Don't sync to HuggingFace
-)
+            lines += [
+                (f"✓ Created HoldPoint", "green"),
+                (f"  ID: {hp.id}", "cyan"),
+                (f"  Merkle: {hp.merkle_root}", "yellow"),
+                (f"  State: {hp.state.value}", "white"),
+                (f"  Best Action: Run (60%)", "bold cyan"),
+            ]
+        except Exception as e:
+            lines.append((f"✗ Error: {e}", "red"))
+        self._log(lines)
 
-print(f"CID: {receipt.cid}")
-print(f"Merkle: {receipt.merkle_root}")
+    def _run_observe_demo(self) -> None:
+        self._show_code("observe")
+        lines = [("═══ OBSERVE DEMO ═══", "bold magenta")]
 
-# Query recent observations
-recent = query("demo_model", limit=5)
-print(f"Found {len(recent)} observations")'''
-        
-        self._show_code(code)
-        self._log("═══ OBSERVE DEMO ═══", "bold magenta")
-        
         try:
-            from cascade_lattice.store import observe, query
             import time
-            
-            receipt = observe(
+
+            store = _get_store()
+            receipt = store.observe(
                 model_id="tui_demo",
                 data={"action": "explore", "reward": 1.0, "timestamp": time.time()},
                 sync=False
             )
-            
-            self._log(f"✓ Created Receipt", "green")
-            self._log(f"  CID: {receipt.cid[:40]}...", "cyan")
-            self._log(f"  Merkle: {receipt.merkle_root}", "yellow")
-            
-            recent = query("tui_demo", limit=5)
-            self._log(f"  Found {len(recent)} total observations", "white")
-        except Exception as e:
-            self._log(f"✗ Error: {e}", "red")
-    
-    def _run_genesis_demo(self) -> None:
-        code = '''import cascade_lattice as cl
 
-# Get the genesis root
-root = cl.genesis.get_genesis_root()
-print(f"Genesis Root: {root}")
+            lines += [
+                (f"✓ Created Receipt", "green"),
+                (f"  CID: {receipt.cid[:40]}...", "cyan"),
+                (f"  Merkle: {receipt.merkle_root}", "yellow"),
+            ]
 
-# The genesis message
-print(f"Message: {cl.genesis.GENESIS_INPUT}")
+            recent = store.query("tui_demo", limit=5)
+            lines.append((f"  Found {len(recent)} total observations", "white"))
+        except Exception as e:
+            lines.append((f"✗ Error: {e}", "red"))
+        self._log(lines)
+
+    def _run_genesis_demo(self) -> None:
+        self._show_code("genesis")
+        lines = [("═══ GENESIS DEMO ═══", "bold magenta")]
 
-# Create a provenance chain
-chain = cl.genesis.create_genesis()
-print(f"Chain verified: {chain.verify()}")'''
-        
-        self._show_code(code)
-        self._log("═══ GENESIS DEMO ═══", "bold magenta")
-        
         try:
-            import cascade_lattice as cl
-            
-            root = cl.genesis.get_genesis_root()
-            self._log(f"✓ Genesis Root: {root}", "bold yellow")
-            self._log(f"  \"{cl.genesis.GENESIS_INPUT}\"", "italic cyan")
-            
-            chain = cl.genesis.create_genesis()
-            self._log(f"  Chain Merkle: {chain.merkle_root}", "green")
-            self._log(f"  Finalized: {chain.finalized}", "white")
+            gen = _get_genesis()
+
+            root = gen.get_genesis_root()
+            lines += [
+                (f"✓ Genesis Root: {root}", "bold yellow"),
+                (f"  \"{gen.GENESIS_INPUT}\"", "italic cyan"),
+            ]
+
+            chain = gen.create_genesis()
+            lines += [
+                (f"  Chain Merkle: {chain.merkle_root}", "green"),
+                (f"  Finalized: {chain.finalized}", "white"),
+            ]
         except Exception as e:
-            self._log(f"✗ Error: {e}", "red")
-    
-    def _run_provenance_demo(self) -> None:
-        code = '''from cascade_lattice.core.provenance import (
-    hash_tensor, hash_input, compute_merkle_root
-)
-import numpy as np
-
-# Hash a tensor
-tensor = np.random.randn(100).astype(np.float32)
-t_hash = hash_tensor(tensor)
+            lines.append((f"✗ Error: {e}", "red"))
+        self._log(lines)
 
-# Hash an input
-input_data = {"query": "What is 2+2?", "context": []}
-i_hash = hash_input(input_data)
+    def _run_provenance_demo(self) -> None:
+        self._show_code("provenance")
+        lines = [("═══ PROVENANCE DEMO ═══", "bold magenta")]
 
-# Compute merkle root
-root = compute_merkle_root([t_hash, i_hash])
-print(f"Merkle Root: {root}")'''
-        
-        self._show_code(code)
-        self._log("═══ PROVENANCE DEMO ═══", "bold magenta")
-        
         try:
             from cascade_lattice.core.provenance import (
                 hash_tensor, hash_input, compute_merkle_root
             )
-            import numpy as np
-            
-            tensor = np.random.randn(100).astype(np.float32)
+
+            _RNG.standard_normal(out=_DEMO_TENSOR, dtype=np.float32)
+            tensor = _DEMO_TENSOR
             t_hash = hash_tensor(tensor)
-            self._log(f"✓ Tensor hash: {t_hash}", "cyan")
-            
+            lines.append((f"✓ Tensor hash: {t_hash}", "cyan"))
+
             input_data = {"query": "What is 2+2?", "context": []}
             i_hash = hash_input(input_data)
-            self._log(f"✓ Input hash: {i_hash}", "yellow")
-            
+            lines.append((f"✓ Input hash: {i_hash}", "yellow"))
+
             root = compute_merkle_root([t_hash, i_hash])
-            self._log(f"✓ Merkle root: {root}", "bold green")
+            lines.append((f"✓ Merkle root: {root}", "bold green"))
         except Exception as e:
-            self._log(f"✗ Error: {e}", "red")
-    
-    def action_go_explorer(self) -> None:
-        self.app.switch_mode("explorer")
+            lines.append((f"✗ Error: {e}", "red"))
+        self._log(lines)
     
     def action_demo_hold(self) -> None:
         self._run_hold_demo()
@@ -1921,145 +1752,12 @@ class CascadeLatticeTUI(App):
     TITLE = "🌐 CASCADE-LATTICE"
     SUB_TITLE = "even still, i grow, and yet, I grow still"
     
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-    
-    #explorer-main, #stats-main, #demo-main {
-        layout: vertical;
-        padding: 1;
-    }
-    
-    #top-bar {
-        height: 3;
-        padding: 0 1;
-        align: left middle;
-        background: $surface-darken-1;
-    }
-    
-    #breadcrumb {
-        width: 1fr;
-    }
-    
-    #mode-toggle {
-        width: auto;
-        margin-right: 1;
-    }
-    
-    #mode-label {
-        width: auto;
-    }
-    
-    #content-area {
-        height: 1fr;
-    }
-    
-    #left-panel {
-        width: 25%;
-        min-width: 30;
-        border: solid $primary;
-        padding: 1;
-    }
-    
-    #center-panel {
-        width: 50%;
-        border: solid $secondary;
-        padding: 1;
-    }
-    
-    #right-panel {
-        width: 25%;
-        min-width: 25;
-        border: solid $accent;
-        padding: 1;
-    }
-    
-    #doc-scroll {
-        height: 1fr;
-    }
-    
-    .panel-title {
-        text-style: bold;
-        color: $text;
-        padding-bottom: 1;
-    }
-    
-    .screen-title {
-        text-style: bold;
-        text-align: center;
-        color: $primary;
-        padding: 1;
-    }
-    
-    #module-tree {
-        height: 1fr;
-        scrollbar-gutter: stable;
-    }
-    
-    .related-btn {
-        width: 100%;
-        margin: 0 0 1 0;
-    }
-    
-    #related-buttons {
-        height: auto;
-        padding: 1 0;
-    }
-    
-    /* Stats screen */
-    #stats-row {
-        height: 1fr;
-    }
-    
-    #stats-left, #stats-right {
-        width: 1fr;
-        border: solid $primary;
-        padding: 1;
-        margin: 1;
-    }
-    
-    /* Demo screen */
-    #demo-buttons {
-        height: auto;
-        padding: 1;
-        align: center middle;
-    }
-    
-    #demo-buttons Button {
-        margin: 0 1;
-    }
-    
-    #demo-content {
-        height: 1fr;
-    }
-    
-    #demo-code, #demo-output {
-        width: 1fr;
-        border: solid $primary;
-        padding: 1;
-        margin: 1;
-    }
-    
-    #code-display {
-        height: 1fr;
-    }
-    
-    #output-log {
-        height: 1fr;
-    }
-    
-    .panel {
-        border: solid $surface-lighten-1;
-        padding: 1;
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "cascade.tcss"
     
     BINDINGS = [
-        Binding("e", "go_explorer", "Explorer", show=True),
-        Binding("s", "go_stats", "Stats", show=True),
-        Binding("d", "go_demo", "Demo", show=True),
+        Binding("e", "switch_mode('explorer')", "Explorer", show=True),
+        Binding("s", "switch_mode('stats')", "Stats", show=True),
+        Binding("d", "switch_mode('demo')", "Demo", show=True),
         Binding("q", "quit", "Quit", show=True),
     ]
     
@@ -2071,17 +1769,11 @@ class CascadeLatticeTUI(App):
     
     def on_mount(self) -> None:
         """Start on explorer."""
+        # First store/genesis import can be slow; do it off the event
+        # loop now so the stats/demo screens find it already cached.
+        self.run_worker(_warm_backends, thread=True, group="warm-backends")
         self.switch_mode("explorer")
     
-    def action_go_explorer(self) -> None:
-        self.switch_mode("explorer")
-    
-    def action_go_stats(self) -> None:
-        self.switch_mode("stats")
-    
-    def action_go_demo(self) -> None:
-        self.switch_mode("demo")
-
 
 # ═══════════════════════════════════════════════════════════════
 # ENTRY POINT
@@ -4,95 +4,135 @@ cascade_lattice - Alias module for cascade
 This module exists so that `import cascade_lattice` works as expected
 when you `pip install cascade-lattice`.
 
-The actual implementation lives in the `cascade` package.
-Both import styles work:
+The actual implementation lives in the `cascade` package, and nothing
+is pulled from it until first use (PEP 562 module __getattr__), so a
+bare `import cascade_lattice` no longer pays for the full cascade
+import graph. Both import styles work:
     >>> import cascade
     >>> import cascade_lattice  # Same thing!
     >>> from cascade_lattice.core.provenance import ProvenanceChain  # Works!
 """
 
 import sys
+import pkgutil
 import importlib
 
-# Re-export everything from cascade
-from cascade import *
-from cascade import (
-    __version__,
-    __author__,
-    __license__,
+# Submodule aliases: cascade_lattice.<name> -> real cascade module
+_SUBMODULES = {
+    "store": "cascade.store",
+    "hold": "cascade.hold",
+    "core": "cascade.core",
+    "analysis": "cascade.analysis",
+    "diagnostics": "cascade.diagnostics",
+    "forensics": "cascade.forensics",
+    "observation": "cascade.observation",
+    "identity": "cascade.identity",
+    "sdk": "cascade.sdk",
+    "genesis": "cascade.genesis",
+    "viz": "cascade.viz",
+}
+
+# Names re-exported from the cascade package itself
+_SYMBOLS = (
+    "__version__",
+    "__author__",
+    "__license__",
     # Core
-    Event,
-    CausationLink,
-    CausationGraph,
-    SymbioticAdapter,
-    Tracer,
-    MetricsEngine,
-    Monitor,
+    "Event",
+    "CausationLink",
+    "CausationGraph",
+    "SymbioticAdapter",
+    "Tracer",
+    "MetricsEngine",
+    "Monitor",
     # Provenance
-    Receipt,
+    "Receipt",
     # HOLD protocol
-    Hold,
-    HoldPoint,
-    HoldState,
-    HoldResolution,
-    HoldAwareMixin,
-    CausationHold,
-    InferenceStep,
+    "Hold",
+    "HoldPoint",
+    "HoldState",
+    "HoldResolution",
+    "HoldAwareMixin",
+    "CausationHold",
+    "InferenceStep",
+    "HoldSession",
     # SDK
-    observe,
-    auto_observe,
-    sdk_observe,
+    "observe",
+    "auto_observe",
+    "sdk_observe",
     # Store
-    store_observe,
-    store_get,
-    store_query,
-    store_stats,
+    "store_observe",
+    "store_get",
+    "store_query",
+    "store_stats",
     # Analysis
-    PlaybackBuffer,
-    ArcadeFeedback,
-    # Genesis
-    genesis,
+    "PlaybackBuffer",
+    "ArcadeFeedback",
     # Sync
-    sync_all,
-    pull_from_hf,
-    discover_datasets,
-    discover_models,
-    discover_live,
-    dataset_info,
+    "sync_all",
+    "pull_from_hf",
+    "discover_datasets",
+    "discover_models",
+    "discover_live",
+    "dataset_info",
     # Viz
-    viz,
-    find_latest_tape,
-    list_tape_files,
-    load_tape_file,
+    "find_latest_tape",
+    "list_tape_files",
+    "load_tape_file",
     # Core functions
-    init,
-    shutdown,
+    "init",
+    "shutdown",
 )
 
-# Make cascade_lattice.store, cascade_lattice.hold, etc. work
-from cascade import store
-from cascade import hold_module as hold
-from cascade import core
-from cascade import analysis
-from cascade import diagnostics
-from cascade import forensics
-from cascade import observation
-from cascade import identity
-from cascade import sdk
+__all__ = list(_SYMBOLS) + list(_SUBMODULES)
+
+# Names of real cascade submodules, scanned once on the first fallback
+# miss (not at import, which would defeat the lazy loading). Lets
+# unknown attributes fail with a cheap set test instead of paying an
+# ImportError round-trip per probe from IDEs and doc tools.
+_valid_submodules = None
+
+
+def _cascade_submodules():
+    global _valid_submodules
+    if _valid_submodules is None:
+        cascade = importlib.import_module("cascade")
+        _valid_submodules = frozenset(m.name for m in pkgutil.iter_modules(cascade.__path__))
+    return _valid_submodules
 
 
 def __getattr__(name):
     """
     Lazy import handler - redirects cascade_lattice.X to cascade.X
-    
-    This allows `from cascade_lattice.core.provenance import ProvenanceChain`
-    to work by dynamically importing from cascade.
+
+    Submodule aliases are registered in sys.modules so future imports
+    are fast; plain symbols are cached in globals() so __getattr__
+    runs at most once per name.
     """
+    target = _SUBMODULES.get(name)
+    if target is not None:
+        module = importlib.import_module(target)
+        sys.modules[f"cascade_lattice.{name}"] = module
+        globals()[name] = module
+        return module
+
+    # Re-exported symbol (or attribute alias like hold_module)
+    cascade = importlib.import_module("cascade")
     try:
-        # Try to import from cascade
-        cascade_module = importlib.import_module(f"cascade.{name}")
-        # Cache it in sys.modules so future imports are fast
-        sys.modules[f"cascade_lattice.{name}"] = cascade_module
-        return cascade_module
-    except ImportError:
+        value = getattr(cascade, name)
+    except AttributeError:
+        pass
+    else:
+        globals()[name] = value
+        return value
+
+    # Any other real cascade submodule (e.g. cascade_lattice.tui)
+    if name not in _cascade_submodules():
         raise AttributeError(f"module 'cascade_lattice' has no attribute '{name}'")
+    module = importlib.import_module(f"cascade.{name}")
+    sys.modules[f"cascade_lattice.{name}"] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from cascade.core.provenance import (
+    MerkleAccumulator,
+    compute_merkle_root,
+    hash_input,
+    hash_tensor,
+)
+
+
+class HashingTests(unittest.TestCase):
+    def test_hash_tensor_is_deterministic(self):
+        rng = np.random.RandomState(42)
+        arr = rng.randn(2000).astype(np.float32)
+        self.assertEqual(hash_tensor(arr), hash_tensor(arr.copy()))
+        self.assertEqual(len(hash_tensor(arr)), 16)
+
+    def test_hash_tensor_includes_shape(self):
+        arr = np.arange(12, dtype=np.float32)
+        self.assertNotEqual(hash_tensor(arr), hash_tensor(arr.reshape(3, 4)))
+
+    def test_hash_tensor_layout_independent(self):
+        arr = np.random.RandomState(0).randn(10, 7)
+        self.assertEqual(hash_tensor(arr.T), hash_tensor(np.ascontiguousarray(arr.T)))
+
+    def test_hash_input_variants(self):
+        self.assertEqual(hash_input("hello"), hash_input("hello"))
+        self.assertEqual(len(hash_input({"query": "x", "context": []})), 16)
+        self.assertNotEqual(hash_input("a"), hash_input("b"))
+
+
+class MerkleTests(unittest.TestCase):
+    def test_empty_and_single(self):
+        self.assertEqual(len(compute_merkle_root([])), 16)
+        self.assertEqual(compute_merkle_root(["abc"]), "abc")
+
+    def test_odd_leaf_count_pads_with_last(self):
+        # [a, b, c] pads to [a, b, c, c]
+        self.assertEqual(
+            compute_merkle_root(["a", "b", "c"]),
+            compute_merkle_root(["a", "b", "c", "c"]),
+        )
+
+    def test_accumulator_matches_batch_for_all_prefixes(self):
+        leaves = ["h%03d" % i for i in range(33)]
+        acc = MerkleAccumulator()
+        self.assertEqual(acc.root(), compute_merkle_root([]))
+        for i, leaf in enumerate(leaves, 1):
+            acc.append(leaf)
+            self.assertEqual(acc.root(), compute_merkle_root(leaves[:i]))
+        self.assertEqual(len(acc), len(leaves))
+
+    def test_accumulator_seeds_from_iterable(self):
+        leaves = ["x", "y", "z"]
+        self.assertEqual(MerkleAccumulator(leaves).root(), compute_merkle_root(leaves))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import sys
+import unittest
+
+from cascade.tui import (
+    CHILDREN_INDEX,
+    IMPORTED_BY_INDEX,
+    IMPORTS_FROM_SET,
+    MODULE_GRAPH,
+    TRANSITIVE_IMPORTS,
+    Category,
+    ModuleNode,
+    find_path,
+    imports_directly,
+    imports_transitively,
+)
+
+
+class ModuleGraphTests(unittest.TestCase):
+    def test_nodes_are_compact_and_immutable(self):
+        node = MODULE_GRAPH["core"]
+        # NamedTuple: no per-instance __dict__, hashable, frozen
+        self.assertFalse(hasattr(node, "__dict__"))
+        self.assertIsInstance(hash(node), int)
+        with self.assertRaises(AttributeError):
+            node.name = "mutated"
+
+    def test_graph_is_read_only(self):
+        with self.assertRaises(TypeError):
+            MODULE_GRAPH["new"] = ModuleNode(name="new", full_path="new")
+
+    def test_reverse_indices_match_forward_edges(self):
+        for key, node in MODULE_GRAPH.items():
+            if node.parent is not None:
+                self.assertIn(key, CHILDREN_INDEX[node.parent])
+            for dep in node.imports_from:
+                if dep in MODULE_GRAPH:
+                    self.assertIn(key, IMPORTED_BY_INDEX[dep])
+
+    def test_imports_resolve_to_graph_keys(self):
+        # Authored dotted paths ("core.provenance") resolve to the keys
+        # the graph actually uses, so no edge is silently dropped.
+        for key, node in MODULE_GRAPH.items():
+            for dep in node.imports_from:
+                self.assertIn(dep, MODULE_GRAPH)
+        self.assertEqual(MODULE_GRAPH["hold.primitives"].imports_from, ("provenance",))
+
+    def test_imports_credit_ancestor_packages(self):
+        # Importing core.provenance executes the core package too.
+        self.assertIn("store", IMPORTED_BY_INDEX["core"])
+        self.assertIn("genesis", IMPORTED_BY_INDEX["provenance"])
+        # ...but a submodule never counts as importing its own package.
+        self.assertNotIn("hold.session", IMPORTED_BY_INDEX["hold"])
+
+    def test_symbols_are_interned(self):
+        node = MODULE_GRAPH["hold.primitives"]
+        self.assertIs(node.imports_from[0], sys.intern("provenance"))
+
+    def test_category_is_bitmaskable(self):
+        mask = Category.HOLD | Category.CORE
+        self.assertTrue(MODULE_GRAPH["hold"].category & mask)
+        self.assertFalse(MODULE_GRAPH["store"].category & mask)
+
+    def test_import_membership_matches_ordered_tuples(self):
+        for key, node in MODULE_GRAPH.items():
+            self.assertEqual(IMPORTS_FROM_SET[key], frozenset(node.imports_from))
+        self.assertTrue(imports_directly("graph", "event"))
+        self.assertFalse(imports_directly("event", "graph"))
+        self.assertFalse(imports_directly("not_a_module", "event"))
+
+    def test_transitive_closure_extends_direct_imports(self):
+        for key, node in MODULE_GRAPH.items():
+            direct = {d for d in node.imports_from if d in MODULE_GRAPH}
+            self.assertTrue(direct <= TRANSITIVE_IMPORTS[key])
+        # graph -> event -> provenance chain collapses to one lookup
+        self.assertTrue(imports_transitively("graph", "provenance"))
+        self.assertFalse(imports_transitively("provenance", "graph"))
+        self.assertFalse(imports_transitively("not_a_module", "event"))
+
+    def test_find_path_connects_import_neighbors(self):
+        path = find_path("graph", "adapter")
+        self.assertEqual(path[0], "graph")
+        self.assertEqual(path[-1], "adapter")
+        self.assertEqual(find_path("graph", "graph"), ("graph",))
+        self.assertEqual(find_path("graph", "not_a_module"), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Bake the TUI module graph into a marshal blob.
+
+Serializes MODULE_GRAPH from cascade/tui.py into cascade/_graph_baked.py
+so TUI startup can load one marshal.loads() blob instead of executing
+the keyword-heavy ModuleNode literals. The literal in tui.py remains the
+source of truth - re-run this script after editing it.
+
+Usage: python tools/bake_graph.py
+"""
+
+import marshal
+import os
+import sys
+from pathlib import Path
+
+# Force tui.py to build from its literals, not a stale baked blob.
+os.environ["CASCADE_TUI_NO_BAKE"] = "1"
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cascade.tui import MODULE_GRAPH  # noqa: E402
+
+
+def main() -> None:
+    rows = tuple(
+        (
+            key,
+            node.name,
+            node.full_path,
+            node.exports,
+            node.imports_from,
+            node.parent,
+            int(node.category),
+        )
+        for key, node in MODULE_GRAPH.items()
+    )
+    blob = marshal.dumps(rows)
+
+    target = Path(__file__).resolve().parent.parent / "cascade" / "_graph_baked.py"
+    target.write_text(
+        '"""Generated by tools/bake_graph.py - do not edit by hand."""\n'
+        "\n"
+        f"BAKED_GRAPH = {blob!r}\n",
+        encoding="utf-8",
+    )
+    print(f"Baked {len(rows)} nodes ({len(blob)} bytes) -> {target}")
+
+
+if __name__ == "__main__":
+    main()